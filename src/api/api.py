@@ -4,13 +4,15 @@ from loguru import logger
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 
-from config import Settings
+from config import load_settings
 
 from storage.database import Database
 from storage.seed import seed_all
 from embedder.factory import get_embedder
+from utils.process_pool import configure_process_pool, shutdown_process_pool
 
 from api.dependencies import verify_internal_api_key
+from api.responses import PydanticJSONResponse
 
 # Import models to register with SQLModel
 from models.source import Source                        # noqa: F401
@@ -45,14 +47,18 @@ async def lifespan(app: FastAPI):
     """Application lifespan management."""
     logger.info("Starting OpenJuris API...")
 
-    settings = Settings()
+    settings = load_settings()
     db = Database(settings)
 
+    # Sized here; the pool itself starts on first use
+    configure_process_pool(settings.process_pool_workers)
+
     # Initialize embedder to get the Embedder's dimensions
     embedder = get_embedder(settings)
     dim = embedder.dimensions
     logger.info(f"Embedding dimensions: {dim}")
-    configure_embedding_dimension(dim)
+    configure_embedding_dimension(dim, settings.embedding_precision)
+    logger.info(f"Embedding precision: {settings.embedding_precision.value}")
 
     await db.create_tables()
 
@@ -67,18 +73,21 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await embedder.close()
     await db.close()
+    shutdown_process_pool()
     logger.info("OpenJuris API shutdown complete.")
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    settings = Settings()
+    settings = load_settings()
 
     app = FastAPI(
         title=settings.app_name,
         description="API for Philippine Legal Documents Archive",
         version="0.1.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=PydanticJSONResponse,
     )
 
     if settings.is_production:
@@ -115,7 +124,10 @@ def create_app() -> FastAPI:
         }
 
     # Public API Endpoint for public users.
-    public_app = FastAPI(root_path="/api/public")
+    public_app = FastAPI(
+        root_path="/api/public",
+        default_response_class=PydanticJSONResponse,
+    )
 
     public_app.add_middleware(
         CORSMiddleware,
@@ -4,7 +4,7 @@ from loguru import logger
 from fastapi import Depends, Request, HTTPException, Header
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
-from config import Settings
+from config import Settings, load_settings
 
 from storage.database import Database
 from storage.repositories.document import DocumentRepository
@@ -16,15 +16,11 @@ from embedder.providers.base import BaseEmbedder
 from services.scraper import ScraperService
 from services.embed import EmbedService
 
-_settings: Settings | None = None
 _database: Database | None = None
 
 def get_settings() -> Settings:
     """Get application settings."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return load_settings()
 
 
 async def get_database(settings: Settings = Depends(get_settings)) -> Database:
@@ -107,9 +103,11 @@ async def get_scraper_service(
         embedder=embedder,
     )
 
-async def verify_internal_api_key(x_api_key: str = Header(..., description="Internal API Key")):
+async def verify_internal_api_key(
+    x_api_key: str = Header(..., description="Internal API Key"),
+    settings: Settings = Depends(get_settings),
+):
     """Verify internal API key for /api/v1 endpoints."""
-    settings = Settings()
     internal_key = getattr(settings, "internal_api_key", None)
 
     if not internal_key:
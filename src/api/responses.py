@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core's Rust serializer.
+
+    Drop-in replacement for JSONResponse that skips the stdlib json module,
+    which is noticeably slower on float-heavy payloads such as embeddings
+    and similarity scores.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
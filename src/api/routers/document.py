@@ -55,7 +55,7 @@ async def get_document(
     repo: DocumentRepository = Depends(get_document_repository),
 ):
     """Get a specific document by ID with rebuilt content (replaces tables with HTML)."""
-    document = await repo.get_by_id(document_id)
+    document = await repo.get_with_parts(document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
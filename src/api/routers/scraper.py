@@ -35,6 +35,7 @@ from scrapers.sc_elibrary.scraper import SCELibraryScraper
 
 from embedder.providers.base import BaseEmbedder
 
+from models.document import Document
 from models.scrape_job import ScrapeJob
 
 from enums.source_name import SourceName
@@ -167,6 +168,19 @@ async def _scrape_document_task(
             logger.error(f"Failed to mark job as failed: {e2}")
 
 
+async def _embed_crawled_documents(
+    documents: list[Document],
+    db: Database,
+    embedder: BaseEmbedder,
+    settings: Settings,
+) -> None:
+    """Embed documents saved by a crawl as one batch, then clear the list."""
+    async with db.session() as session:
+        scraper_service = ScraperService(session=session, settings=settings, embedder=embedder)
+        await scraper_service.embed_documents(documents)
+    documents.clear()
+
+
 async def _crawl_source_task(
     job_id: UUID,
     source: SourceName,
@@ -188,6 +202,11 @@ async def _crawl_source_task(
     documents_scraped = 0
     errors = 0
 
+    # Saved documents are embedded in groups, after their own commit, so
+    # each embed_batch call covers chunks from several documents
+    embed_pending = embed_documents and embedder is not None
+    pending_embeds: list[Document] = []
+
     try:
         async for scraped_doc in scraper.run():
             async with db.session() as session:
@@ -209,13 +228,12 @@ async def _crawl_source_task(
                     scraper_service = ScraperService(
                         session=session,
                         settings=settings,
-                        embedder=embedder if embed_documents else None,
                     )
 
                     document = await scraper_service.save_document(
                         scraped_doc=scraped_doc,
                         source_id=source_record.id,
-                        embed=embed_documents,
+                        embed=False,
                     )
 
                     job = ScrapeJob(
@@ -236,6 +254,15 @@ async def _crawl_source_task(
                     logger.exception(e)
                     errors += 1
                     await session.rollback()
+                    continue
+
+            if embed_pending:
+                pending_embeds.append(document)
+                if len(pending_embeds) >= settings.embed_documents_per_batch:
+                    await _embed_crawled_documents(pending_embeds, db, embedder, settings)
+
+        if pending_embeds:
+            await _embed_crawled_documents(pending_embeds, db, embedder, settings)
 
     except Exception as e:
         logger.error(f"Crawl task failed: {e}")
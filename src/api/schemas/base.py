@@ -0,0 +1,15 @@
+from pydantic import BaseModel, ConfigDict
+
+class FastResponse(BaseModel):
+    """
+    Base for read-only API response models.
+
+    Responses are built once and serialized, so they are frozen and skip
+    assignment validation.
+    """
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+    )
@@ -2,12 +2,12 @@ from uuid import UUID
 from datetime import date
 from typing import Optional, Any
 
-from pydantic import BaseModel
+from api.schemas.base import FastResponse
 
 from enums.document_type import DocumentType
 from enums.document_category import DocumentCategory
 
-class DocumentBase(BaseModel):
+class DocumentBase(FastResponse):
     title: str
     short_title: Optional[str] = None
     canonical_citation: str
@@ -25,9 +25,7 @@ class DocumentResponse(DocumentBase):
     id: UUID
     metadata_fields: dict[str, Any] = {}
 
-    model_config = {"from_attributes": True}
-
-class DocumentListResponse(BaseModel):
+class DocumentListResponse(FastResponse):
     items: list[DocumentResponse]
     total: int
     limit: int
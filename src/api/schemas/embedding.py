@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from api.schemas.base import FastResponse
+
 
 class EmbedTextRequest(BaseModel):
     """Request to embed a single text."""
@@ -20,27 +22,27 @@ class EmbedDocumentRequest(BaseModel):
     force: bool = False
 
 
-class EmbeddingResponse(BaseModel):
+class EmbeddingResponse(FastResponse):
     """Response containing embedding vector."""
     embedding: list[float]
     dimension: int
 
 
-class EmbeddingsResponse(BaseModel):
+class EmbeddingsResponse(FastResponse):
     """Response containing multiple embedding vectors."""
     embeddings: list[list[float]]
     count: int
     dimension: int
 
 
-class DocumentEmbeddingResponse(BaseModel):
+class DocumentEmbeddingResponse(FastResponse):
     """Response for document embedding operation."""
     document_id: UUID
     chunks_created: int
     message: str
 
 
-class SimilarChunk(BaseModel):
+class SimilarChunk(FastResponse):
     """A similar document chunk from search."""
     id: UUID
     document_id: UUID
@@ -58,14 +60,14 @@ class SearchRequest(BaseModel):
     document_id: Optional[UUID] = None
 
 
-class SearchResponse(BaseModel):
+class SearchResponse(FastResponse):
     """Response containing similar chunks."""
     results: list[SimilarChunk]
     query: str
     count: int
 
 
-class DocumentVectorInfo(BaseModel):
+class DocumentVectorInfo(FastResponse):
     """Summary info about a document's vector chunk."""
     id: str
     chunk_index: int
@@ -73,7 +75,7 @@ class DocumentVectorInfo(BaseModel):
     section_title: Optional[str]
 
 
-class DocumentVectorsResponse(BaseModel):
+class DocumentVectorsResponse(FastResponse):
     """Response listing vectors for a document."""
     document_id: UUID
     count: int
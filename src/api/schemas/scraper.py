@@ -4,6 +4,8 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
+from api.schemas.base import FastResponse
+
 from enums.document_type import DocumentType
 from enums.source_name import SourceName
 from enums.scraper_status import ScraperStatus
@@ -17,7 +19,7 @@ class ScrapeRequest(BaseModel):
     embed: bool = True
 
 
-class ScrapeJobResponse(BaseModel):
+class ScrapeJobResponse(FastResponse):
     """Response for scrape job status."""
     id: UUID
     url: str
@@ -28,9 +30,6 @@ class ScrapeJobResponse(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 class CrawlRequest(BaseModel):
     """Request to crawl and scrape all documents of certain types from a source."""
@@ -39,7 +38,7 @@ class CrawlRequest(BaseModel):
     embed: bool = True
 
 
-class CrawlResponse(BaseModel):
+class CrawlResponse(FastResponse):
     """Response for crawl request."""
     job_id: UUID
     source: SourceName
@@ -47,7 +46,7 @@ class CrawlResponse(BaseModel):
     status: str
 
 
-class ScrapeStatusResponse(BaseModel):
+class ScrapeStatusResponse(FastResponse):
     """Overall scrape status."""
     pending: int
     in_progress: int
@@ -55,7 +54,7 @@ class ScrapeStatusResponse(BaseModel):
     failed: int
 
 
-class ScrapeResultResponse(BaseModel):
+class ScrapeResultResponse(FastResponse):
     """Response after a synchronous scrape completes."""
     document_id: Optional[UUID] = None
     canonical_citation: Optional[str] = None
@@ -64,7 +63,7 @@ class ScrapeResultResponse(BaseModel):
     error: Optional[str] = None
 
 
-class SupportedDocumentTypesResponse(BaseModel):
+class SupportedDocumentTypesResponse(FastResponse):
     """Response listing supported document types for a source."""
     source: SourceName
     document_types: list[str]
\ No newline at end of file
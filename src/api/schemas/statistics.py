@@ -2,14 +2,13 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
-class StatisticsResponse(BaseModel):
+from api.schemas.base import FastResponse
+
+class StatisticsResponse(FastResponse):
     id: UUID
     stat_name: str
     stat: int
 
-    class Config:
-        from_attributes = True
-
 class StatisticsCreate(BaseModel):
     id: UUID
     stat_name: str
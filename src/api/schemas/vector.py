@@ -1,9 +1,11 @@
 from uuid import UUID
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-class VectorSearchResult(BaseModel):
+from api.schemas.base import FastResponse
+
+class VectorSearchResult(FastResponse):
     """Response model for vector similarity search results."""
     id: UUID
     document_id: UUID
@@ -12,15 +14,11 @@ class VectorSearchResult(BaseModel):
     section_title: Optional[str] = None
     similarity: float = Field(..., ge=0.0, le=1.0)
 
-    model_config = {"from_attributes": True}
-
 
-class VectorResponse(BaseModel):
+class VectorResponse(FastResponse):
     """Response model for vector data."""
     id: UUID
     document_id: UUID
     chunk_index: int
     content: str
-    section_title: Optional[str] = None
-
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    section_title: Optional[str] = None
\ No newline at end of file
@@ -1,4 +1,6 @@
-from pydantic import computed_field
+from functools import lru_cache
+
+from pydantic import Field, computed_field
 from pydantic_settings import SettingsConfigDict
 
 from enums.app_environment import AppEnvironment
@@ -19,9 +21,23 @@ class Settings(DatabaseSettings, ScraperSettings, EmbedderSettings):
     # --- External APIs ---
     llm_api_key: str | None = None
 
+    # --- Worker processes ---
+    # Size of the shared pool for parsing and chunking; None uses the CPU count
+    process_pool_workers: int | None = Field(default=None, alias="PROCESS_POOL_WORKERS")
+
     model_config = SettingsConfigDict(env_file=".env", env_ignore_empty=True, extra="ignore")
 
     @computed_field
     @property
     def is_production(self) -> bool:
-        return self.environment == AppEnvironment.PRODUCTION
\ No newline at end of file
+        return self.environment == AppEnvironment.PRODUCTION
+
+@lru_cache(maxsize=1)
+def load_settings() -> Settings:
+    """
+    Load the application settings once per process.
+
+    Building Settings re-reads the environment and .env file and validates
+    every field, so callers should share this instance instead.
+    """
+    return Settings()
\ No newline at end of file
@@ -5,12 +5,19 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from enums.embedding_model import EmbeddingModel
 from enums.embedding_provider import EmbeddingProvider
+from enums.embedding_precision import EmbeddingPrecision
 
 class EmbedderSettings(BaseSettings):
     embedding_provider: Optional[EmbeddingProvider] = Field(default=None, alias="EMBEDDING_PROVIDER")
     embedding_model: EmbeddingModel = Field(default=None, alias="EMBEDDING_MODEL")
     embedding_dimension: Optional[int] = Field(default=None, alias="EMBEDDING_DIMENSION")
 
+    # Storage precision of the vector column; float16/int8 are quantized by
+    # libsql on write. Changing it requires recreating document_vectors.
+    embedding_precision: EmbeddingPrecision = Field(
+        default=EmbeddingPrecision.FLOAT32, alias="EMBEDDING_PRECISION"
+    )
+
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
     voyager_api_key: Optional[str] = Field(default=None, alias="VOYAGER_API_KEY")
 
@@ -21,6 +28,12 @@ class EmbedderSettings(BaseSettings):
 
     batch_size: int = 30
 
+    # Documents from a crawl whose chunks are embedded in one batch
+    embed_documents_per_batch: int = Field(default=16, alias="EMBED_DOCUMENTS_PER_BATCH")
+
+    # Run local models in half precision when a CUDA device is available
+    embedding_fp16: bool = Field(default=True, alias="EMBEDDING_FP16")
+
     model_config = SettingsConfigDict(
         env_file=".env", env_ignore_empty=True, extra="ignore"
     )
\ No newline at end of file
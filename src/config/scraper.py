@@ -10,6 +10,8 @@ class ScraperSettings(BaseSettings):
     # Rate limiting
     requests_per_second: float = Field(default=0.5, alias="SCRAPER_REQUESTS_PER_SECOND")
     max_concurrent_requests: int = Field(default=5, alias="SCRAPER_MAX_CONCURRENT_REQUESTS")
+    initial_concurrency: int = Field(default=2, alias="SCRAPER_INITIAL_CONCURRENCY")
+    adjust_overload_rate: float = Field(default=0.1, alias="SCRAPER_ADJUST_OVERLOAD_RATE")
     request_timeout: int = Field(default=30, alias="SCRAPER_REQUEST_TIMEOUT")
 
     # Retry behavior
@@ -19,14 +19,20 @@ class DocumentBuilder:
         parent_id: Optional[UUID] = None,
     ) -> list[DocumentPart]:
         """
-        Recursively convert ScrapedPart trees into flat list of DocumentPart models.
+        Convert ScrapedPart trees into flat list of DocumentPart models.
+
+        Walks the tree depth-first with an explicit stack, so parents are
+        always emitted before their children.
         """
         result: list[DocumentPart] = []
 
-        for part in scraped_parts:
+        stack = [(part, parent_id) for part in reversed(scraped_parts)]
+        while stack:
+            part, part_parent_id = stack.pop()
+
             doc_part = DocumentPart(
                 document_id=document_id,
-                parent_id=parent_id,
+                parent_id=part_parent_id,
                 section_type=part.section_type,
                 label=part.label,
                 content_text=part.content_text or "",
@@ -37,13 +43,8 @@ class DocumentBuilder:
 
             result.append(doc_part)
 
-            # Recursively process children
+            # Push children in reverse so they pop in document order
             if part.children:
-                children = self.build_document_parts(
-                    part.children,
-                    document_id,
-                    parent_id=doc_part.id,
-                )
-                result.extend(children)
+                stack.extend((child, doc_part.id) for child in reversed(part.children))
 
         return result
\ No newline at end of file
@@ -2,6 +2,12 @@ import re
 from typing import Optional
 from bs4 import BeautifulSoup, Tag, NavigableString
 
+# Compiled once at import; used on every text node and cleanup call
+_WHITESPACE_RUN = re.compile(r'\s+')
+_EXCESS_NEWLINES = re.compile(r'\n{3,}')
+_SPACE_AROUND_STAR = re.compile(r'\s+(?=\*)|(?<=\*)\s+')
+_MULTIPLE_SPACES = re.compile(r' {2,}')
+
 
 class HtmlToMarkdown:
     """Convert HTML elements to Markdown formatting."""
@@ -41,7 +47,7 @@ class HtmlToMarkdown:
         if isinstance(element, NavigableString):
             text = str(element)
             # Normalize whitespace but preserve single spaces
-            text = re.sub(r'\s+', ' ', text)
+            text = _WHITESPACE_RUN.sub(' ', text)
             return text
 
         if not isinstance(element, Tag):
@@ -161,20 +167,37 @@ class HtmlToMarkdown:
         if not text:
             return ""
 
+        # Each pass is gated on a plain substring check, so text without
+        # markers skips the regex engine entirely.
+
         # Fix multiple consecutive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        if '\n\n\n' in text:
+            text = _EXCESS_NEWLINES.sub('\n\n', text)
 
-        # Fix spaces around bold/italic markers
-        text = re.sub(r'\*\*\s+', '**', text)
-        text = re.sub(r'\s+\*\*', '**', text)
-        text = re.sub(r'\*\s+', '*', text)
-        text = re.sub(r'\s+\*', '*', text)
+        if '*' in text:
+            # Fix spaces around bold/italic markers
+            text = _SPACE_AROUND_STAR.sub('', text)
 
-        # Remove empty formatting
-        text = re.sub(r'\*\*\*\*', '', text)
-        text = re.sub(r'\*\*', '', text.count('**') % 2 and text or text)
+            # Remove empty formatting
+            text = text.replace('****', '')
+            text = self._drop_unmatched_bold(text)
 
         # Normalize spaces
-        text = re.sub(r' +', ' ', text)
-
-        return text.strip()
\ No newline at end of file
+        if '  ' in text:
+            text = _MULTIPLE_SPACES.sub(' ', text)
+
+        return text.strip()
+
+    def _drop_unmatched_bold(self, text: str) -> str:
+        """Drop the trailing '**' marker if the bold markers are unbalanced."""
+        count = 0
+        last = -1
+        pos = text.find('**')
+        while pos != -1:
+            count += 1
+            last = pos
+            pos = text.find('**', pos + 2)
+
+        if count % 2:
+            return text[:last] + text[last + 2:]
+        return text
\ No newline at end of file
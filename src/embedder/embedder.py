@@ -11,6 +11,9 @@ from schemas.scraped_document import ScrapedDocument
 
 from models.vector import DocumentVector
 
+from storage.repositories.vector import VectorRepository
+from utils.ids import uuid7_batch
+
 from config.embedder import EmbedderSettings
 
 class EmbeddingService:
@@ -30,6 +33,9 @@ class EmbeddingService:
         """
         Embed a scraped document and store vectors in the database.
 
+        Chunks are embedded sorted by length so each embedder batch pads
+        to similar sequence lengths, then restored to document order.
+
         Args:
             document: The scraped document to embed
             document_id: The UUID of the saved Document
@@ -48,7 +54,6 @@ class EmbeddingService:
             logger.warning(f"No content to embed for document {document_id}")
             return []
 
-        # Chunk the content
         chunks = self.chunker.chunk_text(content)
 
         if not chunks:
@@ -57,24 +62,29 @@ class EmbeddingService:
 
         logger.info(f"Embedding {len(chunks)} chunks for document {document_id}")
 
-        # Generate embeddings in batch
-        chunk_texts = [chunk.content for chunk in chunks]
-        embeddings = await self.embedder.embed_batch(chunk_texts)
+        # Embed in length order, then undo the permutation
+        order = sorted(range(len(chunks)), key=lambda i: len(chunks[i].content))
+        sorted_embeddings = await self.embedder.embed_batch(
+            [chunks[i].content for i in order]
+        )
+
+        embeddings: list[Optional[list[float]]] = [None] * len(chunks)
+        for position, i in enumerate(order):
+            embeddings[i] = sorted_embeddings[position]
 
         # Create vector records
-        vectors = []
-        for chunk, embedding in zip(chunks, embeddings):
-            vector = DocumentVector(
-                document_id=document_id,
-                chunk_index=chunk.index,
-                content=chunk.content,
-                section_title=chunk.section_title,
-                embedding=embedding,
-            )
-            session.add(vector)
-            vectors.append(vector)
-
-        await session.flush()
+        rows = [
+            {
+                "id": row_id,
+                "document_id": document_id,
+                "chunk_index": chunk.index,
+                "content": chunk.content,
+                "section_title": chunk.section_title,
+                "embedding": embedding,
+            }
+            for row_id, chunk, embedding in zip(uuid7_batch(len(chunks)), chunks, embeddings)
+        ]
+        vectors = await VectorRepository(session, self.embedder).insert_vectors(rows)
 
         logger.info(f"Created {len(vectors)} vectors for document {document_id}")
         return vectors
@@ -114,45 +124,31 @@ class EmbeddingService:
         chunk_texts = [chunk.content for chunk in chunks]
         embeddings = await self.embedder.embed_batch(chunk_texts)
 
-        vectors = []
-        for chunk, embedding in zip(chunks, embeddings):
-            vector = DocumentVector(
-                document_id=document_id,
-                chunk_index=chunk.index,
-                content=chunk.content,
-                section_title=chunk.section_title,
-                embedding=embedding,
-            )
-            session.add(vector)
-            vectors.append(vector)
-
-        await session.flush()
-        return vectors
+        rows = [
+            {
+                "id": row_id,
+                "document_id": document_id,
+                "chunk_index": chunk.index,
+                "content": chunk.content,
+                "section_title": chunk.section_title,
+                "embedding": embedding,
+            }
+            for row_id, chunk, embedding in zip(uuid7_batch(len(chunks)), chunks, embeddings)
+        ]
+        return await VectorRepository(session, self.embedder).insert_vectors(rows)
 
     def _extract_text_from_parts(self, document: ScrapedDocument) -> str:
-        """Extract text content from document parts."""
+        """Extract text content from document parts, depth-first."""
         texts = []
-        for part in document.parts:
+        stack = list(reversed(document.parts))
+        while stack:
+            part = stack.pop()
             if part.content_markdown:
                 texts.append(part.content_markdown)
             elif part.content_text:
                 texts.append(part.content_text)
 
-            # Recursively get children
-            texts.extend(self._extract_text_from_children(part.children))
-
-        return "\n\n".join(texts)
-
-    def _extract_text_from_children(self, children: list) -> list[str]:
-        """Recursively extract text from child parts."""
-        texts = []
-        for child in children:
-            if child.content_markdown:
-                texts.append(child.content_markdown)
-            elif child.content_text:
-                texts.append(child.content_text)
-
-            if child.children:
-                texts.extend(self._extract_text_from_children(child.children))
+            if part.children:
+                stack.extend(reversed(part.children))
 
-        return texts
\ No newline at end of file
+        return "\n\n".join(texts)
\ No newline at end of file
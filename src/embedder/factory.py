@@ -1,8 +1,6 @@
 from config.embedder import EmbedderSettings
 from enums.embedding_provider import EmbeddingProvider
 from embedder.providers.base import BaseEmbedder
-from embedder.providers.bge_small import BGESmallEmbedder
-from embedder.providers.ollama import OllamaEmbedder
 
 
 def get_embedder(settings: EmbedderSettings) -> BaseEmbedder:
@@ -10,14 +8,13 @@ def get_embedder(settings: EmbedderSettings) -> BaseEmbedder:
     Factory function to create the appropriate embedder based on settings.
 
     If no provider is specified, defaults to BGESmallEmbedder (local).
+    Providers are imported on demand so that torch/sentence-transformers
+    are only loaded when the local embedder is actually selected.
     """
     provider = settings.embedding_provider
 
-    if provider is None:
-        # Default to local BGE Small embedder
-        return BGESmallEmbedder(settings)
-
     if provider == EmbeddingProvider.OLLAMA:
+        from embedder.providers.ollama import OllamaEmbedder
         return OllamaEmbedder(settings)
 
     # if provider == EmbeddingProvider.OPENAI:
@@ -25,5 +22,6 @@ def get_embedder(settings: EmbedderSettings) -> BaseEmbedder:
     # if provider == EmbeddingProvider.VOYAGE:
     #     return VoyageEmbedder(settings)
 
-    # Fallback to BGE Small
-    return BGESmallEmbedder(settings)
\ No newline at end of file
+    # Default (and fallback) to the local BGE Small embedder
+    from embedder.providers.bge_small import BGESmallEmbedder
+    return BGESmallEmbedder(settings)
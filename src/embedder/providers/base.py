@@ -24,6 +24,10 @@ class BaseEmbedder(ABC):
         """Generate embeddings for multiple texts."""
         ...
 
+    async def close(self) -> None:
+        """Release any resources held by the embedder."""
+        return None
+
     async def chat_completion(
         self,
         prompt: str,
@@ -1,21 +1,42 @@
 import asyncio
-
-from sentence_transformers import SentenceTransformer
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from embedder.providers.base import BaseEmbedder
 
 from config.embedder import EmbedderSettings
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+@lru_cache(maxsize=None)
+def _load_model(model_name: str, device: str, fp16: bool) -> "SentenceTransformer":
+    """Load a SentenceTransformer once per (model, device, precision)."""
+    # Imported here so torch is only loaded when a local model is used
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name, device=device)
+    if fp16:
+        model.half()
+    return model
+
 class BGESmallEmbedder(BaseEmbedder):
     def __init__(self, settings: EmbedderSettings):
         super().__init__(settings)
         self.batch_size = settings.batch_size
 
-        self._model = SentenceTransformer(
+        import torch
+
+        use_cuda = torch.cuda.is_available()
+        self._model = _load_model(
             self.settings.embedding_model.value,
-            device="cuda"
+            "cuda" if use_cuda else "cpu",
+            use_cuda and settings.embedding_fp16,
         )
 
+        # Chunks never exceed chunk_size characters, so cap the tokenizer there
+        self._model.max_seq_length = min(self._model.max_seq_length, settings.chunk_size)
+
         self.settings.embedding_dimension = self._model.get_sentence_embedding_dimension()
 
     @property
@@ -24,7 +45,13 @@ class BGESmallEmbedder(BaseEmbedder):
 
     async def embed(self, text: str) -> list[float]:
         """Embeds a single string non-blockingly"""
-        vector = await asyncio.to_thread(self._model.encode, text)
+        vector = await asyncio.to_thread(
+            self._model.encode,
+            text,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
         return vector.tolist()
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
@@ -36,8 +63,9 @@ class BGESmallEmbedder(BaseEmbedder):
             self._model.encode,
             texts,
             batch_size=self.batch_size,
-            show_progress_bar=True,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
         )
 
         return vectors.tolist()
-
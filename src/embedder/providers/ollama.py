@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional
 
 import httpx
@@ -10,25 +11,69 @@ class OllamaEmbedder(BaseEmbedder):
         self.base_url = settings.ollama_host
         self.embedding_model = settings.ollama_model
         self.chat_model = getattr(settings, 'ollama_chat_model', settings.ollama_model)
+        self.batch_size = settings.batch_size
+        self.max_concurrent_requests = settings.max_concurrent_requests
+
+        # Shared client so every request reuses the same keep-alive pool
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrent_requests,
+                max_keepalive_connections=self.max_concurrent_requests,
+                keepalive_expiry=30.0
+            )
+        )
 
     async def embed(self, text: str) -> List[float]:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/embeddings",
+        response = await self._client.post(
+            "/api/embeddings",
+            json={
+                "model": self.embedding_model,
+                "prompt": text
+            }
+        )
+        response.raise_for_status()
+        return response.json()["embedding"]
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        # Send batch_size inputs per /api/embed request, with at most
+        # max_concurrent_requests requests in flight at once.
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        batches = [
+            texts[i:i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+
+        results = await asyncio.gather(
+            *(self._embed_many(semaphore, batch) for batch in batches)
+        )
+
+        return [embedding for batch in results for embedding in batch]
+
+    async def _embed_many(
+        self,
+        semaphore: asyncio.Semaphore,
+        texts: List[str]
+    ) -> List[List[float]]:
+        """Embed a single batch of texts through the /api/embed endpoint."""
+        async with semaphore:
+            response = await self._client.post(
+                "/api/embed",
                 json={
                     "model": self.embedding_model,
-                    "prompt": text
+                    "input": texts
                 }
             )
             response.raise_for_status()
-            return response.json()["embedding"]
+            return response.json()["embeddings"]
 
-    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        embeddings = []
-        for text in texts:
-            embedding = await self.embed(text)
-            embeddings.append(embedding)
-        return embeddings
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
 
     async def chat_completion(
         self,
@@ -47,22 +92,21 @@ class OllamaEmbedder(BaseEmbedder):
         Returns:
             Generated text response
         """
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            payload = {
-                "model": self.chat_model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": temperature
-                }
+        payload = {
+            "model": self.chat_model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": temperature
             }
+        }
 
-            if system_prompt:
-                payload["system"] = system_prompt
+        if system_prompt:
+            payload["system"] = system_prompt
 
-            response = await client.post(
-                f"{self.base_url}/api/generate",
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json().get("response", "")
\ No newline at end of file
+        response = await self._client.post(
+            "/api/generate",
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json().get("response", "")
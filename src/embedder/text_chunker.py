@@ -1,9 +1,33 @@
 import re
-from typing import Optional
+import asyncio
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
 
 from schemas.text_chunk import TextChunk
 
 from config.embedder import EmbedderSettings
+from utils.process_pool import get_process_pool
+
+# Simple sentence splitting - handles common legal citation patterns.
+# Cleaned text has single spaces and no newlines, so a boundary is a
+# terminator, one space and a capital; anchoring on the terminator lets
+# the engine skip straight to candidates instead of testing lookbehinds
+# at every position.
+_SENTENCE_BOUNDARY = re.compile(r'[.!?] (?=[A-Z])')
+
+# How far before the overlap cut to look for a word boundary
+_OVERLAP_BOUNDARY_WINDOW = 32
+
+# Sections up to this length have their chunk spans memoized; long bodies
+# rarely repeat and would only crowd the cache
+_CACHEABLE_TEXT_LENGTH = 4096
+
+# Documents whose parts add up to at least this many characters are
+# chunked in a process pool; below it, pickling costs more than it saves
+_PARALLEL_CHUNKING_LENGTH = 1_000_000
+
+# (content, start, end) of a sentence or chunk within the cleaned text
+_Span = tuple[str, int, int]
 
 class TextChunker:
     """Service to split documents into chunks for embedding"""
@@ -18,151 +42,202 @@ class TextChunker:
         section_title: Optional[str] = None,
     ) -> list[TextChunk]:
         """Split text into overlapping chunks."""
-        if not text or not text.strip():
-            return []
+        return self._to_chunks(self._spans_for(text), section_title)
 
-        # Clean the text
-        text = self._clean_text(text)
+    async def chunk_document_parts(
+        self,
+        parts: list[dict],
+    ) -> list[TextChunk]:
+        """Chunk document parts (sections) individually."""
+        contents = [part.get("content", "") for part in parts]
+
+        # Chunking is pure Python and holds the GIL, so very long documents
+        # are spread across worker processes and awaited off the event loop
+        if len(parts) > 1 and sum(map(len, contents)) >= _PARALLEL_CHUNKING_LENGTH:
+            loop = asyncio.get_running_loop()
+            pool = get_process_pool()
+            part_spans = await asyncio.gather(*(
+                loop.run_in_executor(
+                    pool, _chunk_part_worker, content, self.chunk_size, self.chunk_overlap
+                )
+                for content in contents
+            ))
+        else:
+            part_spans = map(self._spans_for, contents)
 
-        # Try to split on sentence boundaries first
-        sentences = self._split_sentences(text)
-        chunks = self._merge_sentences_to_chunks(sentences)
+        all_chunks = []
+
+        for part, spans in zip(parts, part_spans):
+            # Number chunks globally as they are built instead of
+            # renumbering each part's chunks afterwards
+            all_chunks.extend(
+                self._to_chunks(spans, part.get("title"), first_index=len(all_chunks))
+            )
+
+        return all_chunks
+
+    def _spans_for(self, text: str) -> Iterable[_Span]:
+        """Get the (content, start, end) chunk spans of raw text."""
+        # isspace() answers the same question as strip() without copying
+        if not text or text.isspace():
+            return ()
+
+        # Short sections (preambles, enacting clauses, signature blocks)
+        # repeat across documents, so their spans come from the cache
+        if len(text) <= _CACHEABLE_TEXT_LENGTH:
+            return _cached_chunk_spans(text, self.chunk_size, self.chunk_overlap)
+        return self._chunk_spans(text)
 
+    def _to_chunks(
+        self,
+        spans: Iterable[_Span],
+        section_title: Optional[str],
+        first_index: int = 0,
+    ) -> list[TextChunk]:
+        """Build TextChunks from spans, numbered from first_index."""
         return [
             TextChunk(
-                content=chunk["content"],
+                content=content,
                 index=i,
-                start_char=chunk["start"],
-                end_char=chunk["end"],
+                start_char=start,
+                end_char=end,
                 section_title=section_title,
             )
-            for i, chunk in enumerate(chunks)
+            for i, (content, start, end) in enumerate(spans, first_index)
         ]
 
-    def chunk_document_parts(
-        self,
-        parts: list[dict],
-    ) -> list[TextChunk]:
-        """Chunk document parts (sections) individually."""
-        all_chunks = []
-        chunk_index = 0
-
-        for part in parts:
-            title = part.get("title")
-            content = part.get("content", "")
-
-            part_chunks = self.chunk_text(content, section_title=title)
+    def _chunk_spans(self, text: str) -> Iterator[_Span]:
+        """Clean text and yield its (content, start, end) chunk spans."""
+        # Clean the text
+        text = self._clean_text(text)
 
-            # Update global indices
-            for chunk in part_chunks:
-                chunk.index = chunk_index
-                chunk_index += 1
-                all_chunks.append(chunk)
+        # Text that already fits is a single chunk; skip splitting/merging
+        if len(text) <= self.chunk_size:
+            return iter(((text, 0, len(text)),))
 
-        return all_chunks
+        # Try to split on sentence boundaries first; sentences stream
+        # straight into the merge so neither list is materialized
+        sentences = self._split_sentences(text)
+        return self._merge_sentences_to_chunks(sentences)
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove excessive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        return text.strip()
-
-    def _split_sentences(self, text: str) -> list[dict]:
-        """Split text into sentences with positions."""
-        # Simple sentence splitting - handles common legal citation patterns
-        pattern = r'(?<=[.!?])\s+(?=[A-Z])|(?<=[.!?])\s*\n'
-
-        sentences = []
+        # Collapse every whitespace run (newlines included) to one space.
+        # str.split() uses the same whitespace definition as \s and runs
+        # in a single linear C pass, without going through the regex engine.
+        return ' '.join(text.split())
+
+    def _split_sentences(self, text: str) -> Iterator[_Span]:
+        """Yield (content, start, end) sentence spans from cleaned text."""
+        # Signature blocks and verbatim forms often have no terminator at
+        # all; the whole text is then one sentence and the regex is skipped
+        if '.' not in text and '!' not in text and '?' not in text:
+            if text:
+                yield (text, 0, len(text))
+            return
+
+        # Cleaned text is stripped with single spaces, so every sentence
+        # starts on a non-space and ends right before the boundary's space;
+        # slicing to boundary - 1 needs no strip() and is never empty
         last_end = 0
 
-        for match in re.finditer(pattern, text):
-            sentence = text[last_end:match.start() + 1].strip()
-            if sentence:
-                sentences.append({
-                    "content": sentence,
-                    "start": last_end,
-                    "end": match.start() + 1,
-                })
-            last_end = match.end()
+        for match in _SENTENCE_BOUNDARY.finditer(text):
+            boundary = match.end()
+            yield (text[last_end:boundary - 1], last_end, boundary)
+            last_end = boundary
 
         # Add remaining text
         if last_end < len(text):
-            remaining = text[last_end:].strip()
-            if remaining:
-                sentences.append({
-                    "content": remaining,
-                    "start": last_end,
-                    "end": len(text),
-                })
-
-        return sentences
+            yield (text[last_end:], last_end, len(text))
 
     def _merge_sentences_to_chunks(
         self,
-        sentences: list[dict],
-    ) -> list[dict]:
-        """Merge sentences into chunks of appropriate size."""
-        if not sentences:
-            return []
-
-        chunks = []
-        current_chunk = {
-            "content": "",
-            "start": sentences[0]["start"],
-            "end": sentences[0]["end"],
-        }
-
-        for sentence in sentences:
-            potential_content = (
-                current_chunk["content"] + " " + sentence["content"]
-                if current_chunk["content"]
-                else sentence["content"]
-            )
+        sentences: Iterable[_Span],
+    ) -> Iterator[_Span]:
+        """Merge sentence spans into (content, start, end) chunk spans."""
+        # Settings are read once; the loop below runs per sentence
+        chunk_size = self.chunk_size
+        chunk_overlap = self.chunk_overlap
+        get_overlap_text = self._get_overlap_text
+
+        # Content of the last emitted chunk, used as the overlap source
+        previous_content: Optional[str] = None
+
+        # Buffer the current chunk's sentences and join them only once the
+        # chunk is finalized, instead of re-copying the growing string.
+        current_parts: list[str] = []
+        current_length = 0
+        current_start = 0
+        current_end = 0
+
+        for content, start, end in sentences:
+            if current_parts:
+                potential_length = current_length + 1 + len(content)
+            else:
+                potential_length = len(content)
+                current_start = start
 
-            if len(potential_content) <= self.chunk_size:
-                current_chunk["content"] = potential_content.strip()
-                current_chunk["end"] = sentence["end"]
+            if potential_length <= chunk_size:
+                current_parts.append(content)
+                current_length = potential_length
+                current_end = end
             else:
-                # Save current chunk if it has content
-                if current_chunk["content"]:
-                    chunks.append(current_chunk)
+                # Emit current chunk if it has content
+                if current_parts:
+                    previous_content = " ".join(current_parts)
+                    yield (previous_content, current_start, current_end)
 
                 # Start new chunk, potentially with overlap
-                if chunks and self.chunk_overlap > 0:
+                if previous_content is not None and chunk_overlap > 0:
                     # Get overlap from previous chunk
-                    overlap_text = self._get_overlap_text(
-                        chunks[-1]["content"],
-                        self.chunk_overlap,
+                    overlap_text = get_overlap_text(
+                        previous_content,
+                        chunk_overlap,
                     )
-                    current_chunk = {
-                        "content": overlap_text + " " + sentence["content"],
-                        "start": sentence["start"],
-                        "end": sentence["end"],
-                    }
+                    current_parts = [overlap_text, content]
+                    current_length = len(overlap_text) + 1 + len(content)
                 else:
-                    current_chunk = {
-                        "content": sentence["content"],
-                        "start": sentence["start"],
-                        "end": sentence["end"],
-                    }
+                    current_parts = [content]
+                    current_length = len(content)
+                current_start = start
+                current_end = end
 
-        # Add final chunk
-        if current_chunk["content"]:
-            chunks.append(current_chunk)
-
-        return chunks
+        # Emit final chunk
+        if current_parts:
+            yield (" ".join(current_parts), current_start, current_end)
 
     def _get_overlap_text(self, text: str, target_chars: int) -> str:
         """Get the last N characters of text, breaking at word boundary."""
         if len(text) <= target_chars:
             return text
 
-        # Find word boundary
+        # Find the word boundary at or just before the cut, so the overlap
+        # is never shorter than requested by more than a partial word
         overlap_start = len(text) - target_chars
-        space_pos = text.find(' ', overlap_start)
+        space_pos = text.rfind(
+            ' ',
+            max(0, overlap_start - _OVERLAP_BOUNDARY_WINDOW),
+            overlap_start + 1,
+        )
 
         if space_pos != -1:
             return text[space_pos + 1:]
-        return text[overlap_start:]
\ No newline at end of file
+        return text[overlap_start:]
+
+
+@lru_cache
+def _chunker_for(chunk_size: int, chunk_overlap: int) -> TextChunker:
+    """TextChunker for a settings pair, built once per process."""
+    settings = EmbedderSettings.model_construct(chunk_size=chunk_size, overlap=chunk_overlap)
+    return TextChunker(settings)
+
+
+@lru_cache(maxsize=1024)
+def _cached_chunk_spans(text: str, chunk_size: int, chunk_overlap: int) -> tuple[_Span, ...]:
+    """Memoized _chunk_spans; TextChunk objects are still built per call."""
+    return tuple(_chunker_for(chunk_size, chunk_overlap)._chunk_spans(text))
+
+
+def _chunk_part_worker(text: str, chunk_size: int, chunk_overlap: int) -> list[_Span]:
+    """Chunk one document part in a worker process."""
+    return list(_chunker_for(chunk_size, chunk_overlap)._spans_for(text))
\ No newline at end of file
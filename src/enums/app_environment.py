@@ -1,5 +1,6 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class AppEnvironment(str, Enum):
+@verify(UNIQUE)
+class AppEnvironment(StrEnum):
     DEVELOPMENT = "development"
     PRODUCTION = "production"
\ No newline at end of file
@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class DocumentCategory(str, Enum):
+@verify(UNIQUE)
+class DocumentCategory(StrEnum):
     CONSTITUTION = "Constitution"
     STATUTE = "Statute"
     EXECUTIVE = "Executive"
@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class DocumentType(str, Enum):
+@verify(UNIQUE)
+class DocumentType(StrEnum):
     # --- Constitution ---
     CONSTITUTION = "Constitution"
 
@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class EmbeddingModel(str, Enum):
+@verify(UNIQUE)
+class EmbeddingModel(StrEnum):
     DEFAULT = "BAAI/bge-small-en-v1.5"
 
     # Ollama Embedding Models.
@@ -0,0 +1,7 @@
+from enum import StrEnum, UNIQUE, verify
+
+@verify(UNIQUE)
+class EmbeddingPrecision(StrEnum):
+    FLOAT32 = "float32"
+    FLOAT16 = "float16"
+    INT8 = "int8"
\ No newline at end of file
@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class EmbeddingProvider(str, Enum):
+@verify(UNIQUE)
+class EmbeddingProvider(StrEnum):
     OLLAMA = "Ollama"
     OPENAI = "OpenAI"
     VOYAGE = "Voyage"
\ No newline at end of file
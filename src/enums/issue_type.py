@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class IssueType(str, Enum):
+@verify(UNIQUE)
+class IssueType(StrEnum):
     TYPO = "Typo/Grammar"
     FORMATTING = "Formatting"
     FACTUAL_ERROR = "Factual Error"
@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class RelationType(str, Enum):
+@verify(UNIQUE)
+class RelationType(StrEnum):
     # --- References ---
     CITES = "Cites"
     QUOTES = "Quotes"
@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class SectionType(str, Enum):
+@verify(UNIQUE)
+class SectionType(StrEnum):
     # Document structure
     PREAMBLE = "preamble"
     ENACTING_CLAUSE = "enacting_clause"
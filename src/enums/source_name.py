@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class SourceName(str, Enum):
+@verify(UNIQUE)
+class SourceName(StrEnum):
     OFFICIAL_GAZETTE = "Official Gazette of the Philippines"
     SUPREME_COURT = "The Supreme Court of the Philippines"
     SC_ELIBRARY = "Supreme Court E-Library"
@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class SourceType(str, Enum):
+@verify(UNIQUE)
+class SourceType(StrEnum):
     OFFICIAL_GAZETTE = "Official Gazette"
     GOVERNMENT_REPO = "Government Repo"     # SC E-Library, Senate.gov
     ACADEMIC = "Academic"                   # UP Law Center
@@ -1,6 +1,7 @@
-from enum import Enum
+from enum import StrEnum, UNIQUE, verify
 
-class SourceBaseURL(str, Enum):
+@verify(UNIQUE)
+class SourceBaseURL(StrEnum):
     OFFICIAL_GAZETTE = "https://www.officialgazette.gov.ph/"
     SC_ELIBRARY = "https://elibrary.judiciary.gov.ph"
     LAWPHIL = "https://lawphil.net/"
\ No newline at end of file
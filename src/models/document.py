@@ -6,6 +6,7 @@ from uuid6 import uuid7
 from pydantic import field_validator
 from sqlmodel import SQLModel, Column, JSON, Field, Relationship, Text
 
+from models.types.uuid_type import UUIDType
 from enums.document_category import DocumentCategory
 from enums.document_type import DocumentType
 
@@ -21,7 +22,7 @@ class Document(SQLModel, table=True):
     """The Master Registry"""
     __tablename__ = "documents"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
     canonical_citation: str   # e.g. "G.R. No. 12345", "Republic Act No. 1"
 
     title: str
@@ -33,7 +34,7 @@ class Document(SQLModel, table=True):
     date_published: Optional[date] = None                                  # Gazette
     date_effectivity: Optional[date] = None                                # Law is active
 
-    source_id: Optional[UUID] = Field(default=None, foreign_key="sources.id")
+    source_id: Optional[UUID] = Field(default=None, foreign_key="sources.id", sa_type=UUIDType)
     source_url: str     # Specific deep link
 
     source: Optional["Source"] = Relationship(back_populates="documents")
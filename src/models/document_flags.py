@@ -3,13 +3,14 @@ from uuid import UUID
 from uuid6 import uuid7
 from sqlmodel import SQLModel, Field
 
+from models.types.uuid_type import UUIDType
 from enums.issue_type import IssueType
 
 class DocumentFlags(SQLModel, table=True):
     __tablename__ = "document_flags"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
-    document_id: UUID = Field(foreign_key="documents.id")
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
+    document_id: UUID = Field(foreign_key="documents.id", sa_type=UUIDType)
 
     issue_type: IssueType
     description: str
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import Optional, TYPE_CHECKING
 from uuid6 import uuid7
 from sqlmodel import SQLModel, Field, Relationship
 
+from models.types.uuid_type import UUIDType
 from enums.section_type import SectionType
 
 if TYPE_CHECKING:
@@ -14,14 +15,14 @@ class DocumentPart(SQLModel, table=True):
     """Sections of the document"""
     __tablename__ = "document_parts"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
-    document_id: UUID = Field(foreign_key="documents.id", index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
+    document_id: UUID = Field(foreign_key="documents.id", index=True, sa_type=UUIDType)
 
     # For heirarchy or tree structures. A great example for this is
     # when we have multiple paragraphs for a Section in a Republic Act.
     # We would store all of those paragraph as a child of the original
     # section paragraph.
-    parent_id: Optional[UUID] = Field(foreign_key="document_parts.id", nullable=True)
+    parent_id: Optional[UUID] = Field(foreign_key="document_parts.id", nullable=True, sa_type=UUIDType)
 
     section_type: SectionType                                   # e.g. "Section", "EnactingClause", "Ruling", etc.
     label: Optional[str] = Field(default=None, nullable=True)   # e.g. "Secton 1" or "Article III".
@@ -5,6 +5,7 @@ from datetime import datetime
 from uuid6 import uuid7
 from sqlmodel import SQLModel, Field, Relationship
 
+from models.types.uuid_type import UUIDType
 from enums.relation_type import RelationType
 
 if TYPE_CHECKING:
@@ -14,12 +15,12 @@ class DocumentRelation(SQLModel, table=True):
     """The universal link between documents"""
     __tablename__ = "document_relations"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
 
-    source_id: UUID = Field(foreign_key="documents.id", index=True) # The "Actor" or new/current law
-    target_id: UUID = Field(foreign_key="documents.id", index=True) # The "Target" or old/referenced law
+    source_id: UUID = Field(foreign_key="documents.id", index=True, sa_type=UUIDType) # The "Actor" or new/current law
+    target_id: UUID = Field(foreign_key="documents.id", index=True, sa_type=UUIDType) # The "Target" or old/referenced law
 
-    target_part_id: Optional[UUID] = Field(default=None, foreign_key="document_parts.id")
+    target_part_id: Optional[UUID] = Field(default=None, foreign_key="document_parts.id", sa_type=UUIDType)
 
     relation_type: RelationType     # e.g. "Amends"
     target_scope: str               # e.g. "Section 5" (Human Readable backup)
@@ -5,20 +5,21 @@ from datetime import datetime
 from uuid6 import uuid7
 from sqlmodel import SQLModel, Field
 
+from models.types.uuid_type import UUIDType
 from enums.scraper_status import ScraperStatus
 
 class ScrapeJob(SQLModel, table=True):
     """Track scraping progress and avoid re-scraping"""
     __tablename__ = "scrape_jobs"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
-    source_id: UUID = Field(foreign_key="sources.id", index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
+    source_id: UUID = Field(foreign_key="sources.id", index=True, sa_type=UUIDType)
 
     url: str = Field(unique=True, index=True)   # The full URL of the website that is being
                                                 # scraped.
     status: ScraperStatus = Field(default=ScraperStatus.PENDING)
 
-    document_id: Optional[UUID] = Field(foreign_key="documents.id", nullable=True)
+    document_id: Optional[UUID] = Field(foreign_key="documents.id", nullable=True, sa_type=UUIDType)
 
     error_message: Optional[str] = None
     retry_count: int = Field(default=0)
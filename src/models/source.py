@@ -5,6 +5,7 @@ from typing import Optional, TYPE_CHECKING
 from uuid6 import uuid7
 from sqlmodel import SQLModel, Field, Relationship
 
+from models.types.uuid_type import UUIDType
 from enums.source_type import SourceType
 from enums.source_name import SourceName
 
@@ -15,7 +16,7 @@ class Source(SQLModel, table=True):
     """Registry of where we get data (e.g., Lawphil, SC Library)"""
     __tablename__ = "sources"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
     name: SourceName = Field(unique=True)       # e.g. "Supreme Court E-Library"
     short_code: str = Field(unique=True)        # e.g. "SC-ELIB"
 
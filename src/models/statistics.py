@@ -3,9 +3,11 @@ from uuid import UUID
 from uuid6 import uuid7
 from sqlmodel import SQLModel, Field
 
+from models.types.uuid_type import UUIDType
+
 class Statistics(SQLModel, table=True):
     __tablename__ = "statistics"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
     stat_name: str
     stat: int
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import Optional, TYPE_CHECKING
 from uuid6 import uuid7
 from sqlmodel import SQLModel, Field, Relationship
 
+from models.types.uuid_type import UUIDType
 from models.subject_link import DocumentSubjectLink
 
 if TYPE_CHECKING:
@@ -13,18 +14,21 @@ class Subject(SQLModel, table=True):
     """The taxonomy (e.g., 'Criminal Law', 'Taxation')"""
     __tablename__ = "subjects"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
     name: str = Field(unique=True, index=True) # e.g. "Environmental Law"
     description: Optional[str] = None
 
     # Heirarchy support e.g. Criminal Law -> Crimes Against Property -> Theft
-    parent_id: Optional[UUID] = Field(foreign_key="subjects.id", nullable=True)
+    parent_id: Optional[UUID] = Field(foreign_key="subjects.id", nullable=True, sa_type=UUIDType)
 
+    # Relationships stay lazy so plain subject lookups stay single-table;
+    # read paths choose their loads per query (selectinload/joinedload).
     parent: Optional["Subject"] = Relationship(
         back_populates="children",
         sa_relationship_kwargs={"remote_side": "Subject.id"}
     )
 
+    # Use SubjectExtractionService.get_subject_descendants for whole subtrees.
     children: list["Subject"] = Relationship(back_populates="parent")
 
     # Relationship to the Documents model.
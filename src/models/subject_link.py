@@ -1,16 +1,32 @@
 from uuid import UUID
-from typing import Optional
 
+from sqlalchemy import Column, Index, SmallInteger
 from sqlmodel import SQLModel, Field
 
+from models.types.uuid_type import UUIDType
+
+# Confidence is stored quantized to 0-255, i.e. 1/255 resolution
+CONFIDENCE_SCALE = 255
+
 class DocumentSubjectLink(SQLModel, table=True):
     """Many-to-Many table to link document to subject viceversa"""
     __tablename__ = "document_subjects"
+    __table_args__ = (
+        # Primary-subject lookups per subject are answered from the index
+        Index("ix_link_subject_primary", "subject_id", "is_primary"),
+    )
+
+    document_id: UUID = Field(foreign_key="documents.id", primary_key=True, sa_type=UUIDType)
+    subject_id: UUID = Field(foreign_key="subjects.id", primary_key=True, sa_type=UUIDType)
 
-    document_id: UUID = Field(foreign_key="documents.id", primary_key=True)
-    subject_id: UUID = Field(foreign_key="subjects.id", primary_key=True)
+    confidence_q: int = Field(                          # If an AI tagged the subject, how sure is it?
+        default=CONFIDENCE_SCALE,                       # AI Confidence score, quantized (0 - 255)
+        sa_column=Column(SmallInteger, nullable=False, default=CONFIDENCE_SCALE)
+    )
 
-    confidence: float = Field(default=1.0)              # If an AI tagged the subject, how sure is it?
-                                                        # AI Confidence score (0.0 - 1.0)
+    is_primary: bool = Field(default=False, nullable=False)    # If the topic is the MAIN topic e.g. Criminal Law.
 
-    is_primary: Optional[bool] = Field(default=False)   # If the topic is the MAIN topic e.g. Criminal Law.
\ No newline at end of file
+    @property
+    def confidence(self) -> float:
+        """AI confidence score (0.0 - 1.0)."""
+        return self.confidence_q / CONFIDENCE_SCALE
\ No newline at end of file
@@ -0,0 +1,40 @@
+from uuid import UUID
+
+from sqlalchemy import TypeDecorator, LargeBinary
+
+
+class UUIDType(TypeDecorator):
+    """
+    UUID stored as a 16-byte BLOB instead of hex text, which halves the
+    width of every primary key, foreign key and index entry in SQLite.
+
+    Usage:
+        id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    @staticmethod
+    def to_bytes(value) -> bytes:
+        """16-byte form of a UUID, or of its hex text with or without dashes."""
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        return value.bytes
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.to_bytes(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Rows written before storage.migrations ran still hold hex text
+        if isinstance(value, str):
+            return UUID(value)
+        return UUID(bytes=value)
+
+    @property
+    def python_type(self):
+        return UUID
\ No newline at end of file
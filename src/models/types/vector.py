@@ -1,69 +1,115 @@
 import json
+from functools import lru_cache
 
+import numpy as np
 from sqlalchemy import func, TypeDecorator, LargeBinary, case, null
 from sqlalchemy.types import UserDefinedType
 
+from enums.embedding_precision import EmbeddingPrecision
+
+# libsql column type and vector constructor for each storage precision.
+_COLUMN_TYPES = {
+    EmbeddingPrecision.FLOAT32: "F32_BLOB",
+    EmbeddingPrecision.FLOAT16: "F16_BLOB",
+    EmbeddingPrecision.INT8: "F8_BLOB",
+}
+
+_VECTOR_FUNCTIONS = {
+    EmbeddingPrecision.FLOAT32: "vector32",
+    EmbeddingPrecision.FLOAT16: "vector16",
+    EmbeddingPrecision.INT8: "vector8",
+}
+
+# NumPy dtypes for decoding stored blobs; F8 blobs carry quantization
+# parameters and are returned as raw bytes.
+_BLOB_DTYPES = {
+    EmbeddingPrecision.FLOAT32: np.dtype("<f4"),
+    EmbeddingPrecision.FLOAT16: np.dtype("<f2"),
+}
+
+@lru_cache(maxsize=None)
+def _vector_blob_impl(col_spec: str) -> UserDefinedType:
+    """Build the dialect impl for a vector column spec once and reuse it."""
+
+    class VectorBlobImpl(UserDefinedType):
+        cache_ok = True
+
+        def get_col_spec(self):
+            return col_spec
+
+    return VectorBlobImpl()
 
 class VectorType(TypeDecorator):
     """
-    libsql/SQLite Vector type using F32_BLOB.
+    libsql/SQLite Vector type using F32_BLOB, F16_BLOB or F8_BLOB.
     See also https://turso.tech/blog/turso-brings-native-vector-search-to-sqlite
 
+    Lower precisions are quantized by libsql on write, shrinking every row
+    and the bytes scanned per similarity search.
+
     Usage:
         embedding = Column(VectorType(dim=384))
+        embedding = Column(VectorType(dim=384, precision=EmbeddingPrecision.INT8))
     """
 
     impl = LargeBinary
     cache_ok = True
 
-    def __init__(self, dim: int):
+    def __init__(
+        self,
+        dim: int,
+        precision: EmbeddingPrecision = EmbeddingPrecision.FLOAT32
+    ):
         self.dim = dim
+        self.precision = EmbeddingPrecision(precision)
         super().__init__()
 
-    def load_dialect_impl(self, dialect):
-        dim = self.dim
-
-        class F32_BLOB_Impl(UserDefinedType):
-            cache_ok = True
-
-            def get_col_spec(self):
-                return f"F32_BLOB({dim})"
+    @property
+    def vector_function(self) -> str:
+        """Name of the libsql function that builds a vector of this precision."""
+        return _VECTOR_FUNCTIONS[self.precision]
 
-        return F32_BLOB_Impl()
+    def load_dialect_impl(self, dialect):
+        return _vector_blob_impl(f"{_COLUMN_TYPES[self.precision]}({self.dim})")
 
     def bind_processor(self, dialect):
-        """Convert Python list/tuple to JSON string for the database."""
+        """Pack a list, tuple or ndarray into a little-endian float32 blob."""
         def process(value):
             if value is None:
                 return None
-            if isinstance(value, (list, tuple)):
-                return json.dumps(value)
-            if isinstance(value, str):
-                return value
+            if isinstance(value, (list, tuple, np.ndarray)):
+                return np.asarray(value, dtype="<f4").tobytes()
             return value
         return process
 
     def result_processor(self, dialect, coltype):
-        """Convert database value back to Python list."""
+        """Convert database value back to a float32 ndarray."""
+        dim = self.dim
+        blob_dtype = _BLOB_DTYPES.get(self.precision)
+
         def process(value):
             if value is None:
                 return None
+            if isinstance(value, bytes) and blob_dtype is not None:
+                # Non-F32 blobs end with a type byte, which count= skips
+                vector = np.frombuffer(value, dtype=blob_dtype, count=dim)
+                return vector.astype(np.float32, copy=False)
             if isinstance(value, str):
+                # Legacy JSON text
                 try:
-                    return json.loads(value)
+                    return np.asarray(json.loads(value), dtype=np.float32)
                 except (json.JSONDecodeError, ValueError):
                     return value
-            if isinstance(value, bytes):
-                try:
-                    return json.loads(value.decode("utf-8"))
-                except (json.JSONDecodeError, ValueError, UnicodeDecodeError):
-                    return value
             return value
         return process
 
     def bind_expression(self, bindvalue):
-        """Wrap non-NULL values with vector() function."""
-        return case((bindvalue.is_(None), null()), else_=func.vector(bindvalue))
+        """
+        Wrap non-NULL values with the vector function for this precision.
+        The bound float32 blob is converted to the column's type by libsql.
+        """
+        vector = getattr(func, self.vector_function)
+        return case((bindvalue.is_(None), null()), else_=vector(bindvalue))
 
     def __repr__(self):
-        return f"VectorType(dim={self.dim})"
\ No newline at end of file
+        return f"VectorType(dim={self.dim}, precision={self.precision.value})"
\ No newline at end of file
@@ -1,15 +1,27 @@
-from typing import Optional, List
+from typing import Optional
 from uuid import UUID
 
+import numpy as np
 from sqlmodel import SQLModel, Field
 from sqlalchemy import Column, Text
 from uuid6 import uuid7
 
+from models.types.uuid_type import UUIDType
 from models.types.vector import VectorType
+from enums.embedding_precision import EmbeddingPrecision
 
 # Default dimension, will be overridden at startup
 _DEFAULT_EMBEDDING_DIM = 384
 
+# libsql DiskANN index queried through vector_top_k() for similarity search
+EMBEDDING_INDEX_NAME = "document_vectors_embedding_idx"
+
+# Issued after create_all so databases created before the index get it too
+CREATE_EMBEDDING_INDEX = (
+    f"CREATE INDEX IF NOT EXISTS {EMBEDDING_INDEX_NAME} "
+    "ON document_vectors (libsql_vector_idx(embedding))"
+)
+
 
 def _make_embedding_column(dim: int = _DEFAULT_EMBEDDING_DIM) -> Column:
     return Column(VectorType(dim=dim), nullable=True)
@@ -19,13 +31,14 @@ class DocumentVector(SQLModel, table=True):
     """Vector embeddings for document chunks."""
     __tablename__ = "document_vectors"
 
-    id: UUID = Field(default_factory=uuid7, primary_key=True)
-    document_id: UUID = Field(foreign_key="documents.id", index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, sa_type=UUIDType)
+    document_id: UUID = Field(foreign_key="documents.id", index=True, sa_type=UUIDType)
     chunk_index: int = Field(default=0)
     content: str = Field(sa_column=Column(Text))
     section_title: Optional[str] = Field(default=None)
 
-    embedding: Optional[List[float]] = Field(
+    # Loaded rows hold a float32 ndarray; new rows may be given a list
+    embedding: Optional[np.ndarray] = Field(
         default=None,
         sa_column=_make_embedding_column(_DEFAULT_EMBEDDING_DIM),
     )
@@ -34,10 +47,13 @@ class DocumentVector(SQLModel, table=True):
         arbitrary_types_allowed = True
 
 
-def configure_embedding_dimension(dim: int) -> None:
+def configure_embedding_dimension(
+    dim: int,
+    precision: EmbeddingPrecision = EmbeddingPrecision.FLOAT32
+) -> None:
     """
-    Reconfigure the embedding column dimension before table creation.
-    Must be called before Database.create_tables().
+    Reconfigure the embedding column dimension and storage precision
+    before table creation. Must be called before Database.create_tables().
     """
     table = DocumentVector.__table__
-    table.c.embedding.type = VectorType(dim=dim)
\ No newline at end of file
+    table.c.embedding.type = VectorType(dim=dim, precision=precision)
\ No newline at end of file
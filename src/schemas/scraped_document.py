@@ -7,7 +7,7 @@ from enums.document_category import DocumentCategory
 
 from schemas.scraped_part import ScrapedPart
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedDocument:
     canonical_citation: str
 
@@ -26,6 +26,4 @@ class ScrapedDocument:
     metadata_fields: dict[str, Any] = field(default_factory=dict)
     parts: list[ScrapedPart] = field(default_factory=list)
 
-    raw_html: Optional[str] = None
-
     content_markdown: Optional[str] = None
\ No newline at end of file
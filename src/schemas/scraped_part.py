@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 
 from enums.section_type import SectionType
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedPart:
     section_type: SectionType
 
@@ -1,16 +1,30 @@
-from dataclasses import dataclass
+import re
+from typing import Optional
+from dataclasses import dataclass, field
 
 from enums.document_type import DocumentType
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatutePattern:
     """Configuration for a statute type."""
     document_type: DocumentType
     display_name: str
     abbreviation: str
 
-    patterns: list[str]
-    url_indicators: list[str]
-    title_prefixes: list[str]
+    patterns: tuple[str, ...]
+    url_indicators: frozenset[str]
+    title_prefixes: tuple[str, ...]     # Tuple so it can be passed to str.startswith
 
-    date_fields: list[str]
\ No newline at end of file
+    date_fields: frozenset[str]
+
+    # Citation and title-prefix patterns compiled once when the configuration is built.
+    compiled_patterns: tuple[re.Pattern, ...] = field(init=False, repr=False, compare=False)
+    title_prefix_pattern: Optional[re.Pattern] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "compiled_patterns", tuple(
+            re.compile(pattern, re.IGNORECASE) for pattern in self.patterns
+        ))
+        object.__setattr__(self, "title_prefix_pattern", re.compile(
+            "|".join(re.escape(prefix) for prefix in self.title_prefixes), re.IGNORECASE
+        ) if self.title_prefixes else None)
\ No newline at end of file
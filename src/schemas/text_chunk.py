@@ -2,11 +2,12 @@ from typing import Optional
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class TextChunk:
     """A chunk of text with metadata"""
     content: str
     index: int
+    # Character (not byte) offsets into the whitespace-normalized text
     start_char: int
     end_char: int
     section_title: Optional[str] = None
\ No newline at end of file
@@ -1,5 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Any, AsyncIterator
+from functools import lru_cache
+from typing import Optional, Any, AsyncIterator, Iterator
+from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 from loguru import logger
@@ -11,19 +14,48 @@ from enums.document_type import DocumentType
 from utils.http_client import HttpClient
 
 
+@lru_cache(maxsize=16)
+def _shared_http_client(
+    rate_limit: float,
+    request_timeout: float,
+    max_retries: int,
+    user_agent: str,
+    max_concurrency: int,
+    initial_concurrency: int,
+    adjust_overload_rate: float,
+) -> HttpClient:
+    """
+    One HttpClient per distinct client configuration, so scrapers created
+    with the same settings share a connection pool and a rate limit.
+    """
+    return HttpClient(
+        rate_limit=rate_limit,
+        request_timeout=request_timeout,
+        max_retries=max_retries,
+        user_agent=user_agent,
+        max_concurrency=max_concurrency,
+        initial_concurrency=initial_concurrency,
+        adjust_overload_rate=adjust_overload_rate,
+    )
+
+
 class BaseScraper(ABC):
     """Abstract base class for all scrapers"""
 
     def __init__(self, settings: ScraperSettings, ctx: ScraperContext):
         self.settings = settings
         self.ctx = ctx
-        self.http_client = HttpClient(
-            rate_limit=settings.rate_limit,
-            request_timeout=settings.request_timeout,
-            max_retries=settings.max_retries,
-            user_agent=settings.user_agent,
+        self.http_client = _shared_http_client(
+            settings.rate_limit,
+            settings.request_timeout,
+            settings.max_retries,
+            settings.user_agent,
+            settings.max_concurrent_requests,
+            settings.initial_concurrency,
+            settings.adjust_overload_rate,
         )
-        self.visited_links: list[str] = []
+        self.visited_links: set[str] = set()
+        self._holds_client = False
 
     @property
     @abstractmethod
@@ -61,10 +93,8 @@ class BaseScraper(ABC):
         """Scrape a single document. Must be implemented by subclass."""
         ...
 
-    async def _extract_urls(self, soup: BeautifulSoup, current_url: Optional[str] = None) -> AsyncIterator[str]:
+    def _extract_urls(self, soup: BeautifulSoup, current_url: Optional[str] = None) -> Iterator[str]:
         """Extract all valid URLs from a soup object."""
-        from urllib.parse import urljoin
-
         for link in soup.find_all('a', href=True):
             href = link['href']
             if current_url:
@@ -73,20 +103,33 @@ class BaseScraper(ABC):
             if href not in self.visited_links:
                 yield href
 
+    async def _fetch_index(self, full_url: str) -> Optional[BeautifulSoup]:
+        """Fetch and parse an index page, returning None if it fails."""
+        logger.info(f"Crawling index: {full_url}")
+        try:
+            html = await self.http_client.get_bytes(full_url)
+        except Exception as e:
+            logger.error(f"Failed to crawl index {full_url}: {e}")
+            return None
+        return BeautifulSoup(html, "lxml")
+
     async def run(self) -> AsyncIterator[ScrapedDocument]:
         """Main entry point for crawling and scraping."""
         deep_links = self._get_deep_links(self.ctx.target_document_types)
 
         await self.http_client.start()
+        self._holds_client = True
         try:
-            for doc_type, index_url in deep_links.items():
-                full_url = f"{self.base_url.value}{index_url}"
-                logger.info(f"Crawling index: {full_url}")
+            # Index pages are independent, so fetch them all up front and let
+            # the HTTP client's concurrency limiter bound how many are in flight
+            index_urls = [f"{self.base_url.value}{index_url}" for index_url in deep_links.values()]
+            index_soups = await asyncio.gather(*(self._fetch_index(url) for url in index_urls))
 
-                try:
-                    html = await self.http_client.get_bytes(full_url)
-                    soup = BeautifulSoup(html, "html.parser")
+            for doc_type, full_url, soup in zip(deep_links, index_urls, index_soups):
+                if soup is None:
+                    continue
 
+                try:
                     async for doc_url in self.crawl(soup, full_url):
 
                         try:
@@ -101,7 +144,7 @@ class BaseScraper(ABC):
                     logger.error(f"Failed to crawl index {full_url}: {e}")
                     continue
         finally:
-            await self.http_client.close()
+            await self.close()
 
     @abstractmethod
     async def crawl(self, soup: BeautifulSoup, current_url: str) -> AsyncIterator[str]:
@@ -109,5 +152,7 @@ class BaseScraper(ABC):
         ...
 
     async def close(self):
-        """Close the scraper and release resources."""
-        await self.http_client.close()
\ No newline at end of file
+        """Close the scraper and release its hold on the shared HTTP client."""
+        if self._holds_client:
+            self._holds_client = False
+            await self.http_client.close()
\ No newline at end of file
@@ -22,84 +22,84 @@ STATUTE_PATTERNS: dict[DocumentType, StatutePattern] = {
         document_type=DocumentType.REPUBLIC_ACT,
         display_name=DocumentType.REPUBLIC_ACT.value,
         abbreviation="R.A.",
-        patterns=[
+        patterns=(
             r'\[?\s*(REPUBLIC\s+ACT\s+NO\.?\s*(\d+))\s*\]?',
             r'(Republic\s+Act\s+No\.?\s*(\d+))',
             r'(R\.?\s*A\.?\s*(?:No\.?)?\s*(\d+))',
-        ],
-        url_indicators=["repact", "ra_", "republic_act", "/ra/"],
-        title_prefixes=["AN ACT"],
-        date_fields=["approved", "effectivity"]
+        ),
+        url_indicators=frozenset({"repact", "ra_", "republic_act", "/ra/"}),
+        title_prefixes=("AN ACT",),
+        date_fields=frozenset({"approved", "effectivity"})
     ),
 
     DocumentType.PRESIDENTIAL_DECREE: StatutePattern(
         document_type=DocumentType.PRESIDENTIAL_DECREE,
         display_name=DocumentType.PRESIDENTIAL_DECREE.value,
         abbreviation="P.D.",
-        patterns=[
+        patterns=(
             r'\[?\s*(PRESIDENTIAL\s+DECREE\s+NO\.?\s*(\d+))\s*\]?',
             r'(Presidential\s+Decree\s+No\.?\s*(\d+))',
             r'(P\.?\s*D\.?\s*(?:No\.?)?\s*(\d+))',
-        ],
-        url_indicators=['presdec', 'pd_', 'presidential_decree', '/pd/'],
-        title_prefixes=['DECREEING', 'DECLARING', 'PROVIDING', 'ESTABLISHING', 'CREATING', 'ORDAINING'],
-        date_fields=['promulgated', 'effectivity'],
+        ),
+        url_indicators=frozenset({'presdec', 'pd_', 'presidential_decree', '/pd/'}),
+        title_prefixes=('DECREEING', 'DECLARING', 'PROVIDING', 'ESTABLISHING', 'CREATING', 'ORDAINING'),
+        date_fields=frozenset({'promulgated', 'effectivity'}),
     ),
 
     DocumentType.EXECUTIVE_ORDER: StatutePattern(
         document_type=DocumentType.EXECUTIVE_ORDER,
         display_name="Executive Order",
         abbreviation="E.O.",
-        patterns=[
+        patterns=(
             r'\[?\s*(EXECUTIVE\s+ORDER\s+NO\.?\s*(\d+))\s*\]?',
             r'(Executive\s+Order\s+No\.?\s*(\d+))',
             r'(E\.?\s*O\.?\s*(?:No\.?)?\s*(\d+))',
-        ],
-        url_indicators=['execord', 'eo_', 'executive_order', '/eo/'],
-        title_prefixes=['DIRECTING', 'PROVIDING', 'CREATING', 'ESTABLISHING', 'REORGANIZING', 'ORDERING'],
-        date_fields=['signed', 'effectivity'],
+        ),
+        url_indicators=frozenset({'execord', 'eo_', 'executive_order', '/eo/'}),
+        title_prefixes=('DIRECTING', 'PROVIDING', 'CREATING', 'ESTABLISHING', 'REORGANIZING', 'ORDERING'),
+        date_fields=frozenset({'signed', 'effectivity'}),
     ),
 
     DocumentType.BATAS_PAMBANSA: StatutePattern(
         document_type=DocumentType.BATAS_PAMBANSA,
         display_name="Batas Pambansa",
         abbreviation="B.P.",
-        patterns=[
+        patterns=(
             r'\[?\s*(BATAS\s+PAMBANSA\s+(?:BLG\.?|BILANG)?\s*(\d+))\s*\]?',
             r'(Batas\s+Pambansa\s+(?:Blg\.?|Bilang)?\s*(\d+))',
             r'(B\.?\s*P\.?\s*(?:Blg\.?|Bilang|No\.?)?\s*(\d+))',
-        ],
-        url_indicators=['batas', 'bp_', 'batas_pambansa', '/bp/'],
-        title_prefixes=['AN ACT'],
-        date_fields=['approved', 'effectivity'],
+        ),
+        url_indicators=frozenset({'batas', 'bp_', 'batas_pambansa', '/bp/'}),
+        title_prefixes=('AN ACT',),
+        date_fields=frozenset({'approved', 'effectivity'}),
     ),
 
     DocumentType.COMMONWEALTH_ACT: StatutePattern(
         document_type=DocumentType.COMMONWEALTH_ACT,
         display_name="Commonwealth Act",
         abbreviation="C.A.",
-        patterns=[
+        patterns=(
             r'\[?\s*(COMMONWEALTH\s+ACT\s+NO\.?\s*(\d+))\s*\]?',
             r'(Commonwealth\s+Act\s+No\.?\s*(\d+))',
             r'(C\.?\s*A\.?\s*(?:No\.?)?\s*(\d+))',
-        ],
-        url_indicators=['comact', 'ca_', 'commonwealth_act', '/ca/'],
-        title_prefixes=['AN ACT'],
-        date_fields=['approved', 'effectivity'],
+        ),
+        url_indicators=frozenset({'comact', 'ca_', 'commonwealth_act', '/ca/'}),
+        title_prefixes=('AN ACT',),
+        date_fields=frozenset({'approved', 'effectivity'}),
     ),
 
     DocumentType.ACT: StatutePattern(
         document_type=DocumentType.ACT,
         display_name="Act",
         abbreviation="Act",
-        patterns=[
+        patterns=(
             r'\[?\s*(ACT\s+NO\.?\s*(\d+))\s*\]?',
             r'(Act\s+No\.?\s*(\d+))',
             r'(Act\s+(\d+))',
-        ],
-        url_indicators=['/act/', 'act_', 'actno'],
-        title_prefixes=['AN ACT'],
-        date_fields=['enacted', 'effectivity'],
+        ),
+        url_indicators=frozenset({'/act/', 'act_', 'actno'}),
+        title_prefixes=('AN ACT',),
+        date_fields=frozenset({'enacted', 'effectivity'}),
     ),
 
     # DocumentType.PRESIDENTIAL_PROCLAMATION: StatutePattern(
@@ -120,41 +120,41 @@ STATUTE_PATTERNS: dict[DocumentType, StatutePattern] = {
         document_type=DocumentType.ADMINISTRATIVE_ORDER,
         display_name="Administrative Order",
         abbreviation="A.O.",
-        patterns=[
+        patterns=(
             r'\[?\s*(ADMINISTRATIVE\s+ORDER\s+NO\.?\s*(\d+))\s*\]?',
             r'(Administrative\s+Order\s+No\.?\s*(\d+))',
             r'(A\.?\s*O\.?\s*(?:No\.?)?\s*(\d+))',
-        ],
-        url_indicators=['adminord', 'ao_', 'administrative_order', '/ao/'],
-        title_prefixes=['DIRECTING', 'PRESCRIBING', 'PROVIDING'],
-        date_fields=['issued', 'effectivity'],
+        ),
+        url_indicators=frozenset({'adminord', 'ao_', 'administrative_order', '/ao/'}),
+        title_prefixes=('DIRECTING', 'PRESCRIBING', 'PROVIDING'),
+        date_fields=frozenset({'issued', 'effectivity'}),
     ),
 
     DocumentType.MEMORANDUM_ORDER: StatutePattern(
         document_type=DocumentType.MEMORANDUM_ORDER,
         display_name="Memorandum Order",
         abbreviation="M.O.",
-        patterns=[
+        patterns=(
             r'\[?\s*(MEMORANDUM\s+ORDER\s+NO\.?\s*(\d+))\s*\]?',
             r'(Memorandum\s+Order\s+No\.?\s*(\d+))',
             r'(M\.?\s*O\.?\s*(?:No\.?)?\s*(\d+))',
-        ],
-        url_indicators=['memord', 'mo_', 'memorandum_order', '/mo/'],
-        title_prefixes=['DIRECTING', 'PROVIDING'],
-        date_fields=['issued', 'effectivity'],
+        ),
+        url_indicators=frozenset({'memord', 'mo_', 'memorandum_order', '/mo/'}),
+        title_prefixes=('DIRECTING', 'PROVIDING'),
+        date_fields=frozenset({'issued', 'effectivity'}),
     ),
 
     DocumentType.LETTER_OF_INSTRUCTION: StatutePattern(
         document_type=DocumentType.LETTER_OF_INSTRUCTION,
         display_name="Letter of Instruction",
         abbreviation="LOI",
-        patterns=[
+        patterns=(
             r'\[?\s*(LETTER\s+OF\s+INSTRUCTION\s+NO\.?\s*(\d+))\s*\]?',
             r'(Letter\s+of\s+Instruction\s+No\.?\s*(\d+))',
             r'(LOI\s*(?:No\.?)?\s*(\d+))',
-        ],
-        url_indicators=['loi', 'letter_of_instruction'],
-        title_prefixes=['DIRECTING', 'INSTRUCTING'],
-        date_fields=['issued', 'effectivity'],
+        ),
+        url_indicators=frozenset({'loi', 'letter_of_instruction'}),
+        title_prefixes=('DIRECTING', 'INSTRUCTING'),
+        date_fields=frozenset({'issued', 'effectivity'}),
     ),
 }
\ No newline at end of file
@@ -1,8 +1,13 @@
 import re
+import asyncio
+from functools import lru_cache
+from itertools import chain
 from typing import Optional
 from datetime import date
 
 from bs4 import BeautifulSoup, Tag
+from dateutil import parser as date_parser
+from loguru import logger
 
 from schemas.scraped_document import ScrapedDocument
 from schemas.statute_pattern import StatutePattern
@@ -15,71 +20,152 @@ from enums.document_category import DocumentCategory
 from scrapers.lawphil.constants import STATUTE_PATTERNS
 from converters.html_to_markdown import HtmlToMarkdown
 from converters.markdown_transformer import MarkdownTransformer
+from utils.process_pool import get_process_pool
+
+# Used when a statute type has no title prefixes of its own
+_DEFAULT_TITLE_PREFIX = re.compile(
+    r'AN\s+ACT|DECLARING|PROVIDING|DIRECTING|CREATING|ORDERING',
+    re.IGNORECASE
+)
+
+_DOCUMENT_CATEGORIES: dict[DocumentType, DocumentCategory] = {
+    DocumentType.REPUBLIC_ACT: DocumentCategory.STATUTE,
+    DocumentType.PRESIDENTIAL_DECREE: DocumentCategory.STATUTE,
+    DocumentType.BATAS_PAMBANSA: DocumentCategory.STATUTE,
+    DocumentType.COMMONWEALTH_ACT: DocumentCategory.STATUTE,
+    DocumentType.ACT: DocumentCategory.STATUTE,
+
+    DocumentType.EXECUTIVE_ORDER: DocumentCategory.EXECUTIVE,
+    DocumentType.ADMINISTRATIVE_ORDER: DocumentCategory.EXECUTIVE,
+    DocumentType.MEMORANDUM_ORDER: DocumentCategory.EXECUTIVE,
+    DocumentType.MEMORANDUM_CIRCULAR: DocumentCategory.EXECUTIVE,
+    DocumentType.GENERAL_ORDER: DocumentCategory.EXECUTIVE,
+
+    DocumentType.CONSTITUTION: DocumentCategory.CONSTITUTION,
+}
+
+# Substrings of an element's id or class, and of its text, that mark site chrome
+_BOILERPLATE_ATTRIBUTE = re.compile(
+    r'nav|menu|footer|header|sidebar|banner|ad|copyright',
+    re.IGNORECASE
+)
+_BOILERPLATE_TEXT = re.compile(
+    r'lawphil project|chan robles|copyright|all rights reserved|arellano law foundation',
+    re.IGNORECASE
+)
+
+# Openings of a statute's long title, skipped while still in the header
+_TITLE_STARTERS = (
+    'AN ACT', 'DECLARING', 'PROVIDING', 'DIRECTING', 'CREATING',
+    'ORDERING', 'ESTABLISHING', 'AMENDING', 'REPEALING'
+)
+
+# Elements walked by the title fallback and by body extraction
+_TITLE_ELEMENTS = frozenset({'p', 'div', 'center', 'b', 'i', 'em'})
+_BODY_ELEMENTS = frozenset({'p', 'div', 'blockquote', 'table', 'center', 'pre'})
+
+# Pipes inside a cell would otherwise end the markdown table cell early
+_TABLE_CELL_ESCAPES = str.maketrans({'|': '\\|'})
+
+_CITATION_NUMBER = re.compile(r'No\.\s*(\d+)')
+_BLANK_LINE = re.compile(r'\n\s*\n')
+
+# Shape of the dates captured by _DATE_PATTERNS, checked before any parsing
+_DATE_SHAPE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),?\s*(\d{4})$')
+
+# Month names and abbreviations, lowercased, resolved before falling back to dateutil
+_MONTHS = {
+    name: number
+    for number, month in enumerate((
+        'january', 'february', 'march', 'april', 'may', 'june', 'july',
+        'august', 'september', 'october', 'november', 'december'
+    ), start=1)
+    for name in (month, month[:3])
+}
+_MONTHS['sept'] = 9
+
+_DATE_PATTERNS = {
+    'approved': re.compile(
+        r'(?:Approved|Signed)[:\s]+([A-Za-z]+\s+\d{1,2},?\s*\d{4})',
+        re.IGNORECASE
+    ),
+    'effectivity': re.compile(
+        r'(?:Effectiv(?:e|ity)[:\s]+|take\s+effect\s+(?:on\s+)?|shall\s+take\s+effect\s+)([A-Za-z]+\s+\d{1,2},?\s*\d{4})',
+        re.IGNORECASE
+    ),
+    'promulgated': re.compile(
+        r'(?:Promulgated|Done)[:\s]+([A-Za-z]+\s+\d{1,2},?\s*\d{4})',
+        re.IGNORECASE
+    ),
+}
 
 
 class LawphilStatuteParser:
 
+    # Compiled once at class creation and shared by every parser instance
+    # The shared line-start prefix is factored out and its whitespace run is
+    # possessive: every alternative starts with a letter, so giving whitespace
+    # back can never help, and blank-line runs no longer backtrack per branch
+    _title_terminators = re.compile(
+        r'(?:^|\n)\s*+'
+        r'(?:SEC(?:TION)?\.?\s*\d+'
+        r'|ART(?:ICLE)?\.?\s*[IVXLCDM\d]+'
+        r'|CHAPTER\s*[IVXLCDM\d]+'
+        r'|PRELIMINARY\s+TITLE'
+        r'|GENERAL\s+PROVISIONS'
+        r'|Be\s+it\s+enacted'
+        r'|WHEREAS'
+        r')',
+        re.IGNORECASE | re.MULTILINE
+    )
+
+    _header_pattern = re.compile(
+        r'^\s*\[?\s*(?:REPUBLIC\s+ACT|PRESIDENTIAL\s+DECREE|EXECUTIVE\s+ORDER|'
+        r'BATAS\s+PAMBANSA|COMMONWEALTH\s+ACT|ACT)\s+NO\.?\s*\d+',
+        re.IGNORECASE
+    )
+
+    _enacting_clause_pattern = re.compile(
+        r'Be\s+it\s+enacted\s+by\s+the\s+Senate\s+and\s+House\s+of\s+Representatives',
+        re.IGNORECASE
+    )
+
+    # Article and section markers in one pass; exactly one of the
+    # named number groups is set on a match
+    _part_marker_pattern = re.compile(
+        r'^(?:(?:ARTICLE|ART\.?)\s+(?P<article>[IVXLCDM]+|\d+)'
+        r'|(?:SECTION|SEC\.?)\s+(?P<section>\d+))'
+        r'\.?\s*(?P<title>.*)',
+        re.IGNORECASE
+    )
+
     def __init__(self):
         # Initialize converters
         self.html_converter = HtmlToMarkdown()
         self.markdown_transformer = MarkdownTransformer()
 
-        self._title_terminators = re.compile(
-            r'(?:'
-            r'(?:^|\n)\s*(?:SEC(?:TION)?\.?\s*\d+)'
-            r'|(?:^|\n)\s*(?:ART(?:ICLE)?\.?\s*[IVXLCDM\d]+)'
-            r'|(?:^|\n)\s*(?:CHAPTER\s*[IVXLCDM\d]+)'
-            r'|(?:^|\n)\s*PRELIMINARY\s+TITLE'
-            r'|(?:^|\n)\s*GENERAL\s+PROVISIONS'
-            r'|(?:^|\n)\s*Be\s+it\s+enacted'
-            r'|(?:^|\n)\s*WHEREAS'
-            r')',
-            re.IGNORECASE | re.MULTILINE
-        )
-
-        self._header_pattern = re.compile(
-            r'^\s*\[?\s*(?:REPUBLIC\s+ACT|PRESIDENTIAL\s+DECREE|EXECUTIVE\s+ORDER|'
-            r'BATAS\s+PAMBANSA|COMMONWEALTH\s+ACT|ACT)\s+NO\.?\s*\d+',
-            re.IGNORECASE
-        )
-
-        self._enacting_clause_pattern = re.compile(
-            r'Be\s+it\s+enacted\s+by\s+the\s+Senate\s+and\s+House\s+of\s+Representatives',
-            re.IGNORECASE
-        )
-
-        self._section_pattern = re.compile(
-            r'^(?:SEC(?:TION)?\.?\s*(\d+)\.?\s*[-–—.]?\s*(.*))',
-            re.IGNORECASE
-        )
-
-        self._article_pattern = re.compile(
-            r'^(?:ART(?:ICLE)?\.?\s*([IVXLCDM\d]+)\.?\s*[-–—.]?\s*(.*))',
-            re.IGNORECASE
-        )
-        self._chapter_pattern = re.compile(
-            r'^(?:CHAPTER\s*([IVXLCDM\d]+)\.?\s*[-–—.]?\s*(.*))',
-            re.IGNORECASE
-        )
-
         self._sort_counter = 0
 
     def parse(self, html: str, url: str, doc_type: DocumentType) -> Optional[ScrapedDocument]:
         """Parse a LawPhil statute page."""
         self._reset_sort_counter()
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         config = self._get_pattern_for_type(doc_type)
         if not config:
             return None
 
-        statute_info = self._extract_info(soup, config)
+        # Serialize the document text once for all of the text extractors
+        full_text = soup.get_text()
+        page_title = soup.title.get_text() if soup.title else None
+
+        statute_info, citation_match = self._extract_info(full_text, page_title, config)
         if not statute_info:
             return None
 
-        title = self._extract_title(soup, config)
-        dates = self._extract_dates(soup, config)
+        title = self._extract_title(soup, full_text, config, citation_match)
+        dates = self._extract_dates(full_text, config)
         parts = self._extract_body_parts(soup)
         category = self._get_category(doc_type)
 
@@ -102,8 +188,7 @@ class LawphilStatuteParser:
                 'statute_number': self._extract_number(statute_info),
                 'dates_raw': dates_raw_json,  # Use JSON-serializable version
             },
-            parts=parts,
-            raw_html=html
+            parts=parts
         )
 
         # Generate full markdown representation using the transformer
@@ -115,89 +200,78 @@ class LawphilStatuteParser:
         """Get the pattern configuration for a document type."""
         return STATUTE_PATTERNS.get(doc_type)
 
-    def _extract_info(self, soup: BeautifulSoup, config: StatutePattern) -> Optional[str]:
-        """Extract canonical citation (e.g., 'Republic Act No. 1')."""
-        full_text = soup.get_text()
+    def _extract_info(
+        self,
+        full_text: str,
+        page_title: Optional[str],
+        config: StatutePattern
+    ) -> tuple[Optional[str], Optional[re.Match]]:
+        """
+        Extract canonical citation (e.g., 'Republic Act No. 1').
 
+        Returns:
+            Tuple of (citation, body_match), where body_match is the match
+            in full_text when the citation was found in the body
+        """
         # Try title first
-        if soup.title:
-            for pattern_str in config.patterns:
-                match = re.search(pattern_str, soup.title.get_text(), re.IGNORECASE)
+        if page_title is not None:
+            for pattern in config.compiled_patterns:
+                match = pattern.search(page_title)
                 if match:
                     number = match.group(2)
-                    return f"{config.display_name} No. {number}"
+                    return f"{config.display_name} No. {number}", None
 
         # Try patterns in body
-        for pattern_str in config.patterns:
-            match = re.search(pattern_str, full_text[:2000], re.IGNORECASE)
+        for pattern in config.compiled_patterns:
+            match = pattern.search(full_text, 0, 2000)
             if match:
                 number = match.group(2)
-                return f"{config.display_name} No. {number}"
+                return f"{config.display_name} No. {number}", match
 
-        return None
+        return None, None
 
     def _get_category(self, doc_type: DocumentType) -> DocumentCategory:
         """Map document type to category."""
-        statute_types = [
-            DocumentType.REPUBLIC_ACT,
-            DocumentType.PRESIDENTIAL_DECREE,
-            DocumentType.BATAS_PAMBANSA,
-            DocumentType.COMMONWEALTH_ACT,
-            DocumentType.ACT,
-        ]
-
-        executive_types = [
-            DocumentType.EXECUTIVE_ORDER,
-            DocumentType.ADMINISTRATIVE_ORDER,
-            DocumentType.MEMORANDUM_ORDER,
-            DocumentType.MEMORANDUM_CIRCULAR,
-            DocumentType.GENERAL_ORDER,
-        ]
-
-        if doc_type in statute_types:
-            return DocumentCategory.STATUTE
-        elif doc_type in executive_types:
-            return DocumentCategory.EXECUTIVE
-        elif doc_type == DocumentType.CONSTITUTION:
-            return DocumentCategory.CONSTITUTION
-        else:
-            return DocumentCategory.STATUTE  # Default
+        return _DOCUMENT_CATEGORIES.get(doc_type, DocumentCategory.STATUTE)  # Default
 
     def _extract_number(self, citation: str) -> Optional[str]:
         """Extract just the number from citation."""
-        match = re.search(r'No\.\s*(\d+)', citation)
+        match = _CITATION_NUMBER.search(citation)
         return match.group(1) if match else None
 
     def _extract_title(
         self,
         soup: BeautifulSoup,
-        pattern_config: StatutePattern
+        full_text: str,
+        pattern_config: StatutePattern,
+        citation_match: Optional[re.Match] = None
     ) -> Optional[str]:
-        """Extract document title."""
-        if pattern_config.title_prefixes:
-            prefix_pattern = "|".join(re.escape(p) for p in pattern_config.title_prefixes)
-        else:
-            prefix_pattern = r'AN\s+ACT|DECLARING|PROVIDING|DIRECTING|CREATING|ORDERING'
+        """
+        Extract document title.
 
-        full_text = soup.get_text()
+        When _extract_info already located the citation in the body, the
+        title is looked for after that match before rescanning the text.
+        """
+        prefix_pattern = pattern_config.title_prefix_pattern or _DEFAULT_TITLE_PREFIX
+
+        statute_matches = chain(
+            (citation_match,) if citation_match else (),
+            (pattern.search(full_text) for pattern in pattern_config.compiled_patterns),
+        )
 
         # Find statute citation in text, then extract title after it
-        for pattern_str in pattern_config.patterns:
-            statute_match = re.search(pattern_str, full_text, re.IGNORECASE)
+        for statute_match in statute_matches:
             if statute_match:
-                # Look for title in text after the citation
-                after_citation = full_text[statute_match.end():statute_match.end() + 5000]
+                # Look for title in the text after the citation, bounding the
+                # search with pos/endpos instead of slicing out a copy
+                window_end = statute_match.end() + 5000
 
                 # Find where the title starts (prefix match)
-                title_start_match = re.search(
-                    rf'({prefix_pattern})',
-                    after_citation,
-                    re.IGNORECASE
-                )
+                title_start_match = prefix_pattern.search(full_text, statute_match.end(), window_end)
 
                 if title_start_match:
                     # Get text from title start
-                    title_text = after_citation[title_start_match.start():]
+                    title_text = full_text[title_start_match.start():window_end]
 
                     # Find where the title ends (section/article/chapter starts)
                     terminator_match = self._title_terminators.search(title_text)
@@ -206,7 +280,7 @@ class LawphilStatuteParser:
                         title = title_text[:terminator_match.start()]
                     else:
                         # No terminator found, try to find a reasonable end
-                        double_newline = re.search(r'\n\s*\n', title_text)
+                        double_newline = _BLANK_LINE.search(title_text)
                         if double_newline and double_newline.start() < 1000:
                             title = title_text[:double_newline.start()]
                         else:
@@ -222,13 +296,22 @@ class LawphilStatuteParser:
 
                     return title
 
-        # Fallback: Look for standalone title elements
-        for tag in soup.find_all(['p', 'div', 'center', 'b', 'i', 'em']):
+        # Fallback: Look for standalone title elements, matching the prefix
+        # case-insensitively instead of uppercasing every element's text
+        if pattern_config.title_prefix_pattern is None:
+            return None
+
+        match_prefix = pattern_config.title_prefix_pattern.match
+        # Walked lazily so the first hit stops the walk; find_all would
+        # collect every matching element up front
+        for tag in soup.descendants:
+            if tag.name not in _TITLE_ELEMENTS:
+                continue
+
             text = tag.get_text(strip=True)
-            for prefix in pattern_config.title_prefixes:
-                if text.upper().startswith(prefix):
-                    if not self._title_terminators.search(text):
-                        return ' '.join(text.split())
+            if match_prefix(text):
+                if not self._title_terminators.search(text):
+                    return ' '.join(text.split())
 
         return None
 
@@ -253,51 +336,56 @@ class LawphilStatuteParser:
             return ""
         return self.html_converter.convert(html)
 
-    def _get_text_with_formatting(self, element: Tag) -> tuple[str, str]:
-        """
-        Extract both plain text and markdown from an element.
-
-        Returns:
-            Tuple of (plain_text, markdown_text)
-        """
-        if element is None:
-            return "", ""
-
-        plain_text = element.get_text(separator=' ', strip=True)
-        markdown_text = self._element_to_markdown(element)
-
-        return plain_text, markdown_text
-
     def _extract_body_parts(self, soup: BeautifulSoup) -> list[ScrapedPart]:
         """Extract document body with structure detection and markdown conversion."""
         parts: list[ScrapedPart] = []
 
         current_article: Optional[ScrapedPart] = None
         current_section: Optional[ScrapedPart] = None
-        current_content: list[tuple[str, str]] = []
+        # Text and markdown of the paragraphs since the last marker, kept
+        # side by side so each can be joined directly at flush time
+        content_text: list[str] = []
+        content_markdown: list[str] = []
 
         passed_header = False
 
         body = soup.find('body') or soup
 
-        for element in body.find_all(['p', 'div', 'blockquote', 'table', 'center', 'pre']):
-            if self._is_boilerplate(element):
+        # Bound once; these run for every element on the page
+        is_boilerplate = self._is_boilerplate
+        match_part_marker = self._part_marker_pattern.match
+        to_markdown = self._element_to_markdown
+
+        # A lazy walk with a set check; find_all would build the full list
+        # of matches first and test each node against a list of names
+        for element in body.descendants:
+            if element.name not in _BODY_ELEMENTS:
+                continue
+
+            # Spacer elements are skipped on their first non-blank string
+            # instead of serializing their whole subtree; tables are kept
+            # even when empty
+            if element.name != 'table' and next(element.stripped_strings, None) is None:
+                continue
+
+            # Serialize the element's text once for the boilerplate check and parsing
+            text = element.get_text(separator=' ', strip=True)
+
+            if is_boilerplate(element, text):
                 continue
 
             # Handle tables
             if element.name == 'table':
-                if current_content:
+                if content_text:
                     self._flush_content(
-                        current_content, current_section, current_article, parts
+                        content_text, content_markdown, current_section, current_article, parts
                     )
-                    current_content = []
 
                 table_md = self._table_to_markdown(element)
-                table_text = element.get_text(separator=' ', strip=True)
 
                 table_part = ScrapedPart(
                     section_type=SectionType.TABLE,
-                    content_text=table_text,
+                    content_text=text,
                     content_markdown=table_md,
                     content_html=str(element),
                     sort_order=self._next_sort_order()
@@ -311,23 +399,21 @@ class LawphilStatuteParser:
                     parts.append(table_part)
                 continue
 
-            text, markdown = self._get_text_with_formatting(element)
-
             if not text:
                 continue
 
+            markdown = to_markdown(element)
+
+            marker_match = match_part_marker(text)
+            part_title = marker_match['title'].strip() if marker_match else ""
+
             # Check for article markers
-            article_match = re.match(
-                r'^(ARTICLE|ART\.?)\s+([IVXLCDM]+|\d+)\.?\s*(.*)',
-                text, re.IGNORECASE
-            )
-            if article_match:
+            if marker_match and marker_match['article'] is not None:
                 passed_header = True
-                if current_content:
+                if content_text:
                     self._flush_content(
-                        current_content, current_section, current_article, parts
+                        content_text, content_markdown, current_section, current_article, parts
                     )
-                    current_content = []
 
                 if current_section and current_article:
                     current_article.children.append(current_section)
@@ -336,31 +422,23 @@ class LawphilStatuteParser:
                 if current_article:
                     parts.append(current_article)
 
-                label = f"Article {article_match.group(2)}"
-                title_text = article_match.group(3).strip() if article_match.group(3) else ""
-
                 current_article = ScrapedPart(
                     section_type=SectionType.ARTICLE,
-                    label=label,
-                    content_text=title_text,
-                    content_markdown=title_text,
+                    label=f"Article {marker_match['article']}",
+                    content_text=part_title,
+                    content_markdown=part_title,
                     sort_order=self._next_sort_order()
                 )
                 current_section = None
                 continue
 
             # Check for section markers
-            section_match = re.match(
-                r'^(SECTION|SEC\.?)\s+(\d+)\.?\s*(.*)',
-                text, re.IGNORECASE
-            )
-            if section_match:
+            if marker_match:
                 passed_header = True
-                if current_content:
+                if content_text:
                     self._flush_content(
-                        current_content, current_section, current_article, parts
+                        content_text, content_markdown, current_section, current_article, parts
                     )
-                    current_content = []
 
                 if current_section:
                     if current_article:
@@ -368,14 +446,11 @@ class LawphilStatuteParser:
                     else:
                         parts.append(current_section)
 
-                label = f"Section {section_match.group(2)}"
-                title_text = section_match.group(3).strip() if section_match.group(3) else ""
-
                 current_section = ScrapedPart(
                     section_type=SectionType.SECTION,
-                    label=label,
-                    content_text=title_text,
-                    content_markdown=title_text,
+                    label=f"Section {marker_match['section']}",
+                    content_text=part_title,
+                    content_markdown=part_title,
                     sort_order=self._next_sort_order()
                 )
                 continue
@@ -383,11 +458,12 @@ class LawphilStatuteParser:
             if not passed_header and self._is_header_content(text):
                 continue
 
-            current_content.append((text, markdown))
+            content_text.append(text)
+            content_markdown.append(markdown)
 
-        if current_content:
+        if content_text:
             self._flush_content(
-                current_content, current_section, current_article, parts
+                content_text, content_markdown, current_section, current_article, parts
             )
 
         if current_section:
@@ -406,34 +482,28 @@ class LawphilStatuteParser:
         if self._header_pattern.search(text):
             return True
 
-        title_starters = [
-            'AN ACT', 'DECLARING', 'PROVIDING', 'DIRECTING', 'CREATING',
-            'ORDERING', 'ESTABLISHING', 'AMENDING', 'REPEALING'
-        ]
-        text_upper = text.upper().strip()
-        for starter in title_starters:
-            if text_upper.startswith(starter):
-                return True
-
-        return False
+        return text.upper().strip().startswith(_TITLE_STARTERS)
 
     def _flush_content(
         self,
-        content: list[tuple[str, str]],
+        text_parts: list[str],
+        markdown_parts: list[str],
         current_section: Optional[ScrapedPart],
         current_article: Optional[ScrapedPart],
         parts: list[ScrapedPart]
     ) -> None:
-        """Flush accumulated content to appropriate parent."""
-        if not content:
+        """Flush accumulated content to appropriate parent, then clear it."""
+        if not text_parts:
             return
 
-        text_parts = [t for t, m in content]
-        markdown_parts = [m for t, m in content]
-
+        # join hands back the string itself for a single paragraph
         text = '\n'.join(text_parts)
         markdown = '\n\n'.join(markdown_parts)
 
+        # Cleared in place so the caller keeps reusing the same lists
+        text_parts.clear()
+        markdown_parts.clear()
+
         paragraph = ScrapedPart(
             section_type=SectionType.PARAGRAPH,
             content_text=text,
@@ -455,17 +525,14 @@ class LawphilStatuteParser:
             return ""
 
         md_lines = []
+        cell_to_markdown = self._cell_to_markdown
 
         for i, row in enumerate(rows):
             cells = row.find_all(['td', 'th'])
             if not cells:
                 continue
 
-            cell_texts = []
-            for cell in cells:
-                cell_md = self._element_to_markdown(cell)
-                cell_md = re.sub(r'\s+', ' ', cell_md).strip()
-                cell_texts.append(cell_md)
+            cell_texts = [cell_to_markdown(cell) for cell in cells]
 
             md_lines.append("| " + " | ".join(cell_texts) + " |")
 
@@ -475,21 +542,28 @@ class LawphilStatuteParser:
 
         return "\n".join(md_lines)
 
-    def _extract_dates(self, soup: BeautifulSoup, config: StatutePattern) -> dict:
+    def _cell_to_markdown(self, cell: Tag) -> str:
+        """Convert a table cell's content to single-line Markdown."""
+        if cell.find(True) is None:
+            # Text-only cells skip the recursive converter
+            text = ''.join(cell.contents)
+        else:
+            # convert_element ends a td/th with its own separator, which the
+            # row already supplies
+            text = self._element_to_markdown(cell).removesuffix('|')
+
+        # str.split() collapses whitespace runs and trims in one C call;
+        # translate() then escapes pipes in a single pass
+        return ' '.join(text.split()).translate(_TABLE_CELL_ESCAPES)
+
+    def _extract_dates(self, full_text: str, config: StatutePattern) -> dict:
         """Extract dates and parse them to date objects."""
         dates = {}
-        text = soup.get_text()
-
-        date_patterns = {
-            'approved': r'(?:Approved|Signed)[:\s]+([A-Za-z]+\s+\d{1,2},?\s*\d{4})',
-            'effectivity': r'(?:Effectiv(?:e|ity)[:\s]+|take\s+effect\s+(?:on\s+)?|shall\s+take\s+effect\s+)([A-Za-z]+\s+\d{1,2},?\s*\d{4})',
-            'promulgated': r'(?:Promulgated|Done)[:\s]+([A-Za-z]+\s+\d{1,2},?\s*\d{4})',
-        }
 
         for date_field in config.date_fields:
-            if date_field in date_patterns:
-                pattern = date_patterns[date_field]
-                match = re.search(pattern, text, re.IGNORECASE)
+            pattern = _DATE_PATTERNS.get(date_field)
+            if pattern:
+                match = pattern.search(full_text)
                 if match:
                     date_str = match.group(1)
                     parsed_date = self._parse_date(date_str)
@@ -498,48 +572,73 @@ class LawphilStatuteParser:
 
         return dates
 
-    def _parse_date(self, date_str: str) -> Optional[date]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date(date_str: str) -> Optional[date]:
         """
         Parse Philippine date format to date object.
         Example: "June 19, 1946" -> date(1946, 6, 19)
+
+        Month names are resolved from _MONTHS; anything else falls back to
+        dateutil. Results are cached since the same dates recur across pages.
         """
-        from dateutil import parser
-        from loguru import logger
+        shape = _DATE_SHAPE.match(date_str)
+        if not shape:
+            logger.warning(f"Failed to parse date '{date_str}': not a 'Month DD, YYYY' date")
+            return None
+
+        month_name, day, year = shape.groups()
+        month = _MONTHS.get(month_name.lower())
+        if month is not None:
+            try:
+                return date(int(year), month, int(day))
+            except ValueError:
+                pass
 
         try:
-            parsed = parser.parse(date_str)
+            parsed = date_parser.parse(date_str)
             return parsed.date()
-        except Exception as e:
+        except (ValueError, OverflowError) as e:
             logger.warning(f"Failed to parse date '{date_str}': {e}")
             return None
 
-    def _is_boilerplate(self, element: Tag) -> bool:
-        """Detect boilerplate elements to skip."""
-        classes = element.get('class', [])
-        element_id = element.get('id', '')
-
-        boilerplate_keywords = [
-            'nav', 'menu', 'footer', 'header', 'sidebar',
-            'banner', 'ad', 'copyright'
-        ]
-
-        for keyword in boilerplate_keywords:
-            if keyword in element_id.lower():
-                return True
-            for cls in classes:
-                if keyword in cls.lower():
-                    return True
-
-        text = element.get_text(strip=True).lower()
-        boilerplate_texts = [
-            'lawphil project',
-            'chan robles',
-            'copyright',
-            'all rights reserved',
-            'arellano law foundation',
-        ]
-
-        if any(x in text for x in boilerplate_texts):
+    def _is_boilerplate(self, element: Tag, text: str) -> bool:
+        """Detect boilerplate elements to skip, given the element's text."""
+        # One search over the id and classes together; no keyword contains a
+        # space, so joining them cannot create a match that spans two values
+        attributes = ' '.join((element.get('id', ''), *element.get('class', ())))
+        if _BOILERPLATE_ATTRIBUTE.search(attributes):
             return True
 
-        return False
\ No newline at end of file
+        return _BOILERPLATE_TEXT.search(text) is not None
+
+
+# Pages at least this large are parsed in the shared process pool; below
+# it, pickling the page and the ScrapedDocument across costs more than it saves
+_PARALLEL_PARSE_BYTES = 500_000
+
+
+@lru_cache(maxsize=1)
+def _process_parser() -> LawphilStatuteParser:
+    """Parser for the current process (the scraper's or a pool worker's), built once."""
+    return LawphilStatuteParser()
+
+
+def _parse_worker(html: bytes, url: str, doc_type: DocumentType) -> Optional[ScrapedDocument]:
+    """Parse one statute page in a worker process."""
+    return _process_parser().parse(html, url, doc_type)
+
+
+async def parse_statute(html: bytes, url: str, doc_type: DocumentType) -> Optional[ScrapedDocument]:
+    """
+    Parse a LawPhil statute page.
+
+    Parsing is pure Python and holds the GIL, so large pages go to the
+    shared worker pool to leave the event loop free for fetching; the
+    rest are parsed in place.
+    """
+    if len(html) < _PARALLEL_PARSE_BYTES:
+        return _process_parser().parse(html, url, doc_type)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), _parse_worker, html, url, doc_type)
\ No newline at end of file
@@ -1,3 +1,5 @@
+import asyncio
+from collections import deque
 from typing import Optional, AsyncIterator
 
 from loguru import logger
@@ -12,18 +14,24 @@ from enums.source_url import SourceBaseURL
 from enums.source_name import SourceName
 from enums.document_type import DocumentType
 
-from scrapers.lawphil.parsers.statute_parser import LawphilStatuteParser
+from scrapers.lawphil.parsers.statute_parser import parse_statute
 
 from scrapers.lawphil.constants import LAWPHIL_PATHS
 
 from config import Settings
 
+# Statute pages announce themselves within their first few KB; anything
+# else (PDFs or images behind extensionless links) is skipped unparsed
+_HTML_SNIFF_BYTES = 4096
+_HTML_MARKERS = (b"<html", b"<!doctype html")
+
 class LawphilScraper(BaseScraper):
 
     def __init__(self, settings: Settings, ctx: ScraperContext):
         super().__init__(settings, ctx)
         self.ctx = ctx
-        self.statute_parser = LawphilStatuteParser()
+        # Pages fetched by crawl, handed to scrape_document instead of refetching
+        self._fetched_html: dict[str, bytes] = {}
 
     @property
     def source_name(self) -> SourceName:
@@ -40,32 +48,62 @@ class LawphilScraper(BaseScraper):
         """URL registry for this scraper. Must be defined by subclass."""
         return LAWPHIL_PATHS
 
-    async def crawl(self, soup: BeautifulSoup, current_url: str) -> AsyncIterator[str]:
-
-        async for statute in self._extract_urls(soup.find("table", id="s-menu"), current_url):
-            logger.debug(f"Getting HTML for {statute}")
-            try:
-                html = await self.http_client.get_bytes(statute)
-            except Exception:
-                logger.debug(f"HTML extraction failed for {statute}")
-                continue
+    async def _fetch_statute(self, statute: str) -> Optional[bytes]:
+        """Fetch a statute page, or None if the request failed."""
+        logger.debug(f"Getting HTML for {statute}")
+        try:
+            return await self.http_client.get_bytes(statute)
+        except Exception:
+            logger.debug(f"HTML extraction failed for {statute}")
+            return None
 
-            if ".pdf" in statute:
-                logger.warning(f"Skipping {statute} because of PDF")
-                continue
-
-            soup = BeautifulSoup(html, "html.parser")
-            self.visited_links.append(statute)
-
-            yield statute
+    async def crawl(self, soup: BeautifulSoup, current_url: str) -> AsyncIterator[str]:
+        statutes = self._extract_urls(soup.find("table", id="s-menu"), current_url)
+
+        # Keep a window of fetches running ahead of the consumer, so downloads
+        # overlap with the parsing done for the URLs already yielded; the HTTP
+        # client's limiter still bounds how many requests are in flight
+        window = self.settings.max_concurrent_requests
+        pending: deque[tuple[str, asyncio.Task]] = deque()
+
+        try:
+            while True:
+                while len(pending) < window and (statute := next(statutes, None)) is not None:
+                    if ".pdf" in statute:
+                        logger.warning(f"Skipping {statute} because of PDF")
+                        continue
+                    pending.append((statute, asyncio.create_task(self._fetch_statute(statute))))
+
+                if not pending:
+                    break
+
+                statute, fetch = pending.popleft()
+                html = await fetch
+                if html is None:
+                    continue
+
+                head = html[:_HTML_SNIFF_BYTES].lower()
+                if not any(marker in head for marker in _HTML_MARKERS):
+                    logger.warning(f"Skipping {statute} because it is not an HTML page")
+                    continue
+
+                self.visited_links.add(statute)
+                self._fetched_html[statute] = html
+
+                yield statute
+        finally:
+            for _, fetch in pending:
+                fetch.cancel()
 
     async def scrape_document(self, doc_url: str, doc_type: DocumentType) -> Optional[ScrapedDocument]:
         logger.debug(f"Scraping {doc_type} from: {doc_url}")
 
-        html = await self.http_client.get_bytes(doc_url)
+        html = self._fetched_html.pop(doc_url, None)
+        if html is None:
+            html = await self.http_client.get_bytes(doc_url)
 
         if "/statutes/" in doc_url:
-            document = self.statute_parser.parse(html, doc_url, doc_type)
+            document = await parse_statute(html, doc_url, doc_type)
             document.metadata_fields["source_name"] = self.source_name.value
 
             return document
@@ -1,10 +1,13 @@
 from typing import Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from schemas.scraped_part import ScrapedPart
 from schemas.scraped_document import ScrapedDocument
 
+# Only the content column is read, so nothing else needs to be built into the tree
+_CONTENT_STRAINER = SoupStrainer("div", id="left")
+
 class SCELibStatuteParser:
 
     def __init__(self):
@@ -12,7 +15,7 @@ class SCELibStatuteParser:
 
     def parse(self, html: str, url: str, recursion: Optional[bool] = False) -> Optional[ScrapedDocument]:
         """Parse the statute page"""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml", parse_only=_CONTENT_STRAINER)
 
         content_div = soup.find("div", id="left")
         print(content_div)
\ No newline at end of file
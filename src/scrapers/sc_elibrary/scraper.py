@@ -39,12 +39,12 @@ class SCELibraryScraper(BaseScraper):
         return SC_ELIB_PATHS
 
     async def crawl(self, soup: BeautifulSoup) -> AsyncIterator[str]:
-        async for month in self._extract_urls(soup.find("div", id="container_date")):
+        for month in self._extract_urls(soup.find("div", id="container_date")):
             html = await self.http_client.get(month)
-            soup = BeautifulSoup(html, "html.parser")
-            self.visited_links.append(month)
+            soup = BeautifulSoup(html, "lxml")
+            self.visited_links.add(month)
 
-            async for doc in self._extract_urls(soup.find("div", id="left")):
+            for doc in self._extract_urls(soup.find("div", id="left")):
                 yield doc
 
     async def scrape_document(self, doc_url: str) -> Optional[ScrapedDocument]:
@@ -15,6 +15,7 @@ from models.vector import DocumentVector
 
 from storage.repositories.vector import VectorRepository
 from storage.repositories.document import DocumentRepository
+from utils.ids import uuid7_batch
 
 
 class EmbedService:
@@ -73,19 +74,18 @@ class EmbedService:
         chunk_texts = [chunk.content for chunk in chunks]
         embeddings = await self.embedder.embed_batch(chunk_texts)
 
-        vectors = []
-        for chunk, embedding in zip(chunks, embeddings):
-            vector = DocumentVector(
-                document_id=document_id,
-                chunk_index=chunk.index,
-                content=chunk.content,
-                section_title=chunk.section_title,
-                embedding=embedding,
-            )
-            self.session.add(vector)
-            vectors.append(vector)
-
-        await self.session.flush()
+        rows = [
+            {
+                "id": row_id,
+                "document_id": document_id,
+                "chunk_index": chunk.index,
+                "content": chunk.content,
+                "section_title": chunk.section_title,
+                "embedding": embedding,
+            }
+            for row_id, chunk, embedding in zip(uuid7_batch(len(chunks)), chunks, embeddings)
+        ]
+        vectors = await VectorRepository(self.session, self.embedder).insert_vectors(rows)
 
         logger.info(f"Created {len(vectors)} vectors for document {document_id}")
         return vectors
@@ -130,19 +130,18 @@ class EmbedService:
         chunk_texts = [chunk.content for chunk in chunks]
         embeddings = await self.embedder.embed_batch(chunk_texts)
 
-        vectors = []
-        for chunk, embedding in zip(chunks, embeddings):
-            vector = DocumentVector(
-                document_id=document_id,
-                chunk_index=chunk.index,
-                content=chunk.content,
-                section_title=chunk.section_title,
-                embedding=embedding,
-            )
-            self.session.add(vector)
-            vectors.append(vector)
-
-        await self.session.flush()
+        rows = [
+            {
+                "id": row_id,
+                "document_id": document_id,
+                "chunk_index": chunk.index,
+                "content": chunk.content,
+                "section_title": chunk.section_title,
+                "embedding": embedding,
+            }
+            for row_id, chunk, embedding in zip(uuid7_batch(len(chunks)), chunks, embeddings)
+        ]
+        vectors = await VectorRepository(self.session, self.embedder).insert_vectors(rows)
         return vectors
 
     async def search_similar(
@@ -183,28 +182,17 @@ class EmbedService:
         return await vector_repo.delete_by_document(document_id)
 
     def _extract_text_from_parts(self, document: ScrapedDocument) -> str:
-        """Extract text content from document parts."""
+        """Extract text content from document parts, depth-first."""
         texts = []
-        for part in document.parts:
+        stack = list(reversed(document.parts))
+        while stack:
+            part = stack.pop()
             if part.content_markdown:
                 texts.append(part.content_markdown)
             elif part.content_text:
                 texts.append(part.content_text)
 
-            texts.extend(self._extract_text_from_children(part.children))
-
-        return "\n\n".join(texts)
-
-    def _extract_text_from_children(self, children: list) -> list[str]:
-        """Recursively extract text from child parts."""
-        texts = []
-        for child in children:
-            if child.content_markdown:
-                texts.append(child.content_markdown)
-            elif child.content_text:
-                texts.append(child.content_text)
-
-            if child.children:
-                texts.extend(self._extract_text_from_children(child.children))
+            if part.children:
+                stack.extend(reversed(part.children))
 
-        return texts
\ No newline at end of file
+        return "\n\n".join(texts)
\ No newline at end of file
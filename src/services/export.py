@@ -13,14 +13,14 @@ import httpx
 from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from models.document import Document
 from models.document_part import DocumentPart
 from models.subject import Subject
 from models.source import Source
 from models.document_relation import DocumentRelation
-from config import Settings
+from config import load_settings
 
 
 class JSONEncoderExtended(json.JSONEncoder):
@@ -39,7 +39,7 @@ class ExportService:
 
     def __init__(self, session: AsyncSession):
         self.session = session
-        self.settings = Settings()
+        self.settings = load_settings()
 
     async def export_all(self, output_dir: str = "exports") -> str:
         """
@@ -100,7 +100,7 @@ class ExportService:
         """Export subjects to CSV and JSON."""
         logger.info("Exporting subjects...")
 
-        result = await self.session.execute(select(Subject))
+        result = await self.session.execute(select(Subject).options(raiseload('*')))
         subjects = result.scalars().all()
 
         data = []
@@ -122,7 +122,10 @@ class ExportService:
         logger.info("Exporting documents...")
 
         result = await self.session.execute(
-            select(Document).options(selectinload(Document.subjects))
+            select(Document).options(
+                selectinload(Document.subjects),
+                raiseload('*'),
+            )
         )
         documents = result.scalars().all()
 
@@ -1,10 +1,11 @@
-from typing import AsyncIterator, Optional, List, Any
+from typing import AsyncIterator, Optional, List, Any, Sequence
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
 from config import Settings
 from embedder.providers.base import BaseEmbedder
+from embedder.text_chunker import TextChunker
 from enums.document_type import DocumentType
 from enums.source_name import SourceName
 from enums.scraper_status import ScraperStatus
@@ -93,7 +94,7 @@ class ScraperService:
 
         # Embed if requested
         if embed and self.embedder:
-            await self._embed_document(document)
+            await self.embed_documents([document])
 
         return document
 
@@ -130,38 +131,69 @@ class ScraperService:
 
         return result
 
-    async def _embed_document(self, document: Document) -> None:
-        """Generate and store embeddings for a document."""
-        if not self.embedder:
-            return
+    async def embed_documents(self, documents: Sequence[Document]) -> int:
+        """
+        Chunk and embed several saved documents with a single embed_batch
+        call, so a crawl pays the embedder's per-call overhead once per
+        group of documents rather than once per document.
+
+        Chunks from every document are embedded sorted by length, so each
+        embedder batch pads to similar sequence lengths, and the vectors
+        are inserted back in document and chunk order.
+
+        Returns:
+            Number of vectors created
+        """
+        if not self.embedder or not documents:
+            return 0
 
         try:
-            from models.vector import DocumentVector
             from storage.repositories.vector import VectorRepository
-            from uuid6 import uuid7
+            from utils.ids import uuid7_batch
 
-            vector_repo = VectorRepository(self.session, self.embedder)
+            chunker = TextChunker(self.settings)
 
-            # Embed the full content
-            content = document.content_markdown or ""
-            if not content:
-                return
+            document_ids = []
+            chunks = []
+            for document in documents:
+                for chunk in chunker.chunk_text(document.content_markdown or ""):
+                    document_ids.append(document.id)
+                    chunks.append(chunk)
 
-            embedding = await self.embedder.embed(content)
+            if not chunks:
+                return 0
 
-            vector = DocumentVector(
-                id=uuid7(),
-                document_id=document.id,
-                embedding=embedding,
-                chunk_index=0,
-                chunk_text=content[:1000],  # Store first 1000 chars as reference
+            # Embed in length order, then undo the permutation
+            order = sorted(range(len(chunks)), key=lambda i: len(chunks[i].content))
+            sorted_embeddings = await self.embedder.embed_batch(
+                [chunks[i].content for i in order]
             )
-            await vector_repo.create(vector)
 
-            logger.debug(f"Created embedding for document {document.id}")
+            embeddings: list[Optional[list[float]]] = [None] * len(chunks)
+            for position, i in enumerate(order):
+                embeddings[i] = sorted_embeddings[position]
+
+            rows = [
+                {
+                    "id": row_id,
+                    "document_id": document_id,
+                    "chunk_index": chunk.index,
+                    "content": chunk.content,
+                    "section_title": chunk.section_title,
+                    "embedding": embedding,
+                }
+                for row_id, document_id, chunk, embedding in zip(
+                    uuid7_batch(len(chunks)), document_ids, chunks, embeddings
+                )
+            ]
+            vectors = await VectorRepository(self.session, self.embedder).insert_vectors(rows)
+
+            logger.debug(f"Created {len(vectors)} embeddings for {len(documents)} documents")
+            return len(vectors)
 
         except Exception as e:
-            logger.warning(f"Failed to embed document {document.id}: {e}")
+            logger.warning(f"Failed to embed {len(documents)} documents: {e}")
+            return 0
 
     async def scrape_single(
         self,
@@ -1,7 +1,10 @@
 import json
+from uuid import UUID
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from loguru import logger
 
 from embedder.providers.base import BaseEmbedder
@@ -222,37 +225,64 @@ Return ONLY the JSON array, no additional text or explanation."""
             subjects.append(subject)
         return subjects
 
+    async def get_subject_descendants(self, root_id: UUID) -> List[Subject]:
+        """
+        Get a subject and every subject below it in the hierarchy.
+
+        The whole subtree comes back from one recursive CTE instead of
+        walking children level by level.
+        """
+        tree = (
+            select(Subject.id)
+            .where(Subject.id == root_id)
+            .cte(name="subject_tree", recursive=True)
+        )
+        tree = tree.union_all(
+            select(Subject.id).where(Subject.parent_id == tree.c.id)
+        )
+
+        # Parents come back in the same SELECT; any other relationship
+        # access raises instead of lazily issuing a query per subject
+        stmt = (
+            select(Subject)
+            .join(tree, Subject.id == tree.c.id)
+            .options(joinedload(Subject.parent), raiseload('*'))
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def link_subjects_to_document(
         self,
         document_id: int,
         subjects: List[Subject]
     ) -> List[DocumentSubjectLink]:
-        """Link subjects to a document."""
-        links = []
+        """
+        Link subjects to a document.
 
-        for subject in subjects:
-            # Check if link already exists
-            stmt = select(DocumentSubjectLink).where(
-                DocumentSubjectLink.document_id == document_id,
-                DocumentSubjectLink.subject_id == subject.id
-            )
-            result = await self.session.execute(stmt)
-            existing = result.scalar_one_or_none()
+        All links are written with one executemany INSERT that skips pairs
+        already linked, then read back with a single SELECT.
+        """
+        subject_ids = list(dict.fromkeys(subject.id for subject in subjects))
+        if not subject_ids:
+            return []
 
-            if existing:
-                links.append(existing)
-                continue
+        await self.session.flush()
+        await self.session.execute(
+            sqlite_insert(DocumentSubjectLink).on_conflict_do_nothing(),
+            [
+                {"document_id": document_id, "subject_id": subject_id}
+                for subject_id in subject_ids
+            ],
+        )
 
-            # Create new link
-            link = DocumentSubjectLink(
-                document_id=document_id,
-                subject_id=subject.id
-            )
-            self.session.add(link)
-            links.append(link)
+        stmt = select(DocumentSubjectLink).where(
+            DocumentSubjectLink.document_id == document_id,
+            DocumentSubjectLink.subject_id.in_(subject_ids)
+        )
+        result = await self.session.execute(stmt)
+        links_by_subject = {link.subject_id: link for link in result.scalars()}
 
-        await self.session.flush()
-        return links
+        return [links_by_subject[subject_id] for subject_id in subject_ids]
 
     async def extract_and_link_subjects(
         self,
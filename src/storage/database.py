@@ -3,6 +3,7 @@ from typing import Optional, AsyncGenerator
 
 from loguru import logger
 from sqlmodel import SQLModel
+from sqlalchemy import event, text
 from sqlalchemy.pool import StaticPool, AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.asyncio.session import AsyncSession
@@ -11,6 +12,10 @@ from exceptions import DatabaseException
 
 from config import Settings
 
+from models.vector import CREATE_EMBEDDING_INDEX
+
+from storage.migrations import upgrade_schema
+
 
 class Database:
 
@@ -31,14 +36,32 @@ class Database:
                 connect_args={"check_same_thread": False},
                 poolclass=StaticPool,
             )
+            event.listen(self.engine.sync_engine, "connect", self._set_local_pragmas)
+
+    @staticmethod
+    def _set_local_pragmas(dbapi_connection, connection_record) -> None:
+        """
+        Tune a local database file for bulk writes such as vector inserts:
+        WAL journaling with NORMAL sync, temp tables kept in memory, and a
+        64 MiB page cache.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
 
     async def create_tables(self) -> None:
         """
-        Create all tables defined by SQLModel metadata.
-        The VectorType handles F32_BLOB column creation automatically.
+        Create all tables defined by SQLModel metadata, then migrate tables
+        left by older releases. The VectorType handles F32_BLOB column
+        creation automatically.
         """
         async with self.engine.begin() as conn:
             await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.run_sync(upgrade_schema)
+            await conn.execute(text(CREATE_EMBEDDING_INDEX))
         logger.info("All tables created successfully")
 
     @asynccontextmanager
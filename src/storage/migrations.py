@@ -0,0 +1,97 @@
+from typing import Callable
+
+from loguru import logger
+from sqlmodel import SQLModel
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from models.types.uuid_type import UUIDType
+from models.subject_link import CONFIDENCE_SCALE, DocumentSubjectLink
+
+
+def _column_names(connection: Connection, table_name: str) -> set[str]:
+    rows = connection.exec_driver_sql(f'PRAGMA table_info("{table_name}")')
+    return {row[1] for row in rows}
+
+
+def _uuid_text_to_blob(connection: Connection) -> None:
+    """
+    Rewrite UUID keys stored as hex text into the 16-byte BLOBs that
+    UUIDType binds. Foreign key checks are deferred to commit, so keys
+    and the columns referencing them can be rewritten in any order; the
+    pragma only holds inside a transaction, which upgrade_schema opens.
+    """
+    connection.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+
+    for table in SQLModel.metadata.sorted_tables:
+        existing = _column_names(connection, table.name)
+
+        for column in table.columns:
+            if not isinstance(column.type, UUIDType) or column.name not in existing:
+                continue
+
+            values = connection.execute(text(
+                f'SELECT DISTINCT "{column.name}" FROM "{table.name}" '
+                f'WHERE typeof("{column.name}") = \'text\''
+            )).scalars().all()
+
+            if not values:
+                continue
+
+            connection.execute(
+                text(f'UPDATE "{table.name}" SET "{column.name}" = :new WHERE "{column.name}" = :old'),
+                [{"new": UUIDType.to_bytes(value), "old": value} for value in values],
+            )
+            logger.info(f"Converted {len(values)} UUID values in {table.name}.{column.name}")
+
+
+def _quantize_subject_confidence(connection: Connection) -> None:
+    """
+    Rebuild document_subjects from the float confidence column into the
+    0-255 confidence_q column, and fill missing is_primary flags with 0.
+    SQLite cannot change a column's type or nullability in place, so the
+    old table is renamed, copied into a fresh one and dropped.
+    """
+    table = DocumentSubjectLink.__table__
+
+    if "confidence_q" in _column_names(connection, table.name):
+        return
+
+    connection.exec_driver_sql(f'ALTER TABLE "{table.name}" RENAME TO "_{table.name}_old"')
+    table.create(connection)
+    connection.exec_driver_sql(
+        f'INSERT INTO "{table.name}" (document_id, subject_id, confidence_q, is_primary) '
+        f'SELECT document_id, subject_id, CAST(round(confidence * {CONFIDENCE_SCALE}) AS INTEGER), '
+        f'coalesce(is_primary, 0) FROM "_{table.name}_old"'
+    )
+    connection.exec_driver_sql(f'DROP TABLE "_{table.name}_old"')
+    logger.info(f"Rebuilt {table.name} with quantized confidence")
+
+
+# Applied in order to databases whose user_version is below the number
+MIGRATIONS: list[tuple[int, Callable[[Connection], None]]] = [
+    (1, _uuid_text_to_blob),
+    (2, _quantize_subject_confidence),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def upgrade_schema(connection: Connection) -> None:
+    """
+    Bring a database created by an older release up to SCHEMA_VERSION.
+    Runs after create_all; the migrations and the version bump share one
+    savepoint, which also starts the transaction on drivers that defer
+    BEGIN until the first DML statement.
+    """
+    version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+    if version >= SCHEMA_VERSION:
+        return
+
+    with connection.begin_nested():
+        for target, migration in MIGRATIONS:
+            if version < target:
+                logger.info(f"Applying schema migration {target}: {migration.__name__}")
+                migration(connection)
+
+        connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
\ No newline at end of file
@@ -1,6 +1,8 @@
+from uuid import UUID
 from typing import Optional, Sequence
 
 from sqlmodel import select
+from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from storage.repositories.base import BaseRepository
@@ -15,6 +17,16 @@ class DocumentRepository(BaseRepository[Document]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Document)
 
+    async def get_with_parts(self, document_id: UUID) -> Optional[Document]:
+        """Get document by ID with its parts loaded in one extra IN query."""
+        statement = (
+            select(Document)
+            .where(Document.id == document_id)
+            .options(selectinload(Document.parts))
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one_or_none()
+
     async def get_by_citation(self, citation: str) -> Optional[Document]:
         """Get document by canonical citation."""
         statement = select(Document).where(Document.canonical_citation == citation)
@@ -1,15 +1,16 @@
-import json
 from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import text
+import numpy as np
+from sqlalchemy import insert, text
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 from loguru import logger
 
 from storage.repositories.base import BaseRepository
-from models.vector import DocumentVector
+from models.vector import DocumentVector, EMBEDDING_INDEX_NAME
 from embedder.providers.base import BaseEmbedder
+from utils.ids import uuid7_batch
 
 
 class VectorRepository(BaseRepository[DocumentVector]):
@@ -51,24 +52,42 @@ class VectorRepository(BaseRepository[DocumentVector]):
         contents = [chunk["content"] for chunk in chunks]
         embeddings = await self.embedder.embed_batch(contents)
 
-        vectors = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            vector = DocumentVector(
-                document_id=document_id,
-                chunk_index=chunk.get("index", i),
-                content=chunk["content"],
-                section_title=chunk.get("section_title"),
-                embedding=embedding,
+        rows = [
+            {
+                "id": row_id,
+                "document_id": document_id,
+                "chunk_index": chunk.get("index", i),
+                "content": chunk["content"],
+                "section_title": chunk.get("section_title"),
+                "embedding": embedding,
+            }
+            for i, (row_id, chunk, embedding) in enumerate(
+                zip(uuid7_batch(len(chunks)), chunks, embeddings)
             )
-            self.session.add(vector)
-            vectors.append(vector)
+        ]
 
-        await self.session.flush()
+        return await self.insert_vectors(rows)
 
-        for vector in vectors:
-            await self.session.refresh(vector)
+    async def insert_vectors(
+        self,
+        rows: list[dict],
+        batch_size: int = 1000,
+    ) -> list[DocumentVector]:
+        """
+        Insert vector rows with executemany INSERTs of up to batch_size rows.
+
+        Rows must carry every column, including the id. The unit of work is
+        bypassed, so the returned DocumentVector objects are not attached
+        to the session.
+        """
+        if not rows:
+            return []
+
+        statement = insert(DocumentVector)
+        for start in range(0, len(rows), batch_size):
+            await self.session.execute(statement, rows[start:start + batch_size])
 
-        return vectors
+        return [DocumentVector(**row) for row in rows]
 
     async def search_similar(
         self,
@@ -77,9 +96,18 @@ class VectorRepository(BaseRepository[DocumentVector]):
         threshold: float = 0.7,
         document_id: Optional[UUID] = None,
     ) -> Sequence[dict]:
-        """Search for similar vectors using cosine similarity."""
+        """
+        Search for similar vectors using cosine similarity.
+
+        Library-wide searches use the libsql vector index through
+        vector_top_k(); searches scoped to one document scan only that
+        document's rows.
+        """
         query_embedding = await self.embedder.embed(query)
-        embedding_str = json.dumps(query_embedding)
+        query_blob = np.asarray(query_embedding, dtype="<f4").tobytes()
+
+        # The query vector must match the column's storage precision
+        vector_fn = DocumentVector.__table__.c.embedding.type.vector_function
 
         # Get raw connection from SQLAlchemy session
         conn = await self.session.connection()
@@ -88,26 +116,26 @@ class VectorRepository(BaseRepository[DocumentVector]):
         # aiolibsql execute returns cursor synchronously, but driver is async
         if document_id:
             cursor = raw_conn.execute(  # No await here
-                """
+                f"""
                 SELECT id, document_id, chunk_index, content, section_title,
-                       vector_distance_cos(embedding, ?) as distance
+                       vector_distance_cos(embedding, {vector_fn}(?)) as distance
                 FROM document_vectors
                 WHERE document_id = ?
                 ORDER BY distance ASC
                 LIMIT ?
                 """,
-                (embedding_str, str(document_id), limit)
+                (query_blob, document_id.bytes, limit)
             )
         else:
             cursor = raw_conn.execute(  # No await here
-                """
-                SELECT id, document_id, chunk_index, content, section_title,
-                       vector_distance_cos(embedding, ?) as distance
-                FROM document_vectors
+                f"""
+                SELECT dv.id, dv.document_id, dv.chunk_index, dv.content, dv.section_title,
+                       vector_distance_cos(dv.embedding, {vector_fn}(?)) as distance
+                FROM vector_top_k('{EMBEDDING_INDEX_NAME}', {vector_fn}(?), ?) AS top
+                JOIN document_vectors AS dv ON dv.rowid = top.id
                 ORDER BY distance ASC
-                LIMIT ?
                 """,
-                (embedding_str, limit)
+                (query_blob, query_blob, limit)
             )
 
         # fetchall() is also synchronous
@@ -118,8 +146,8 @@ class VectorRepository(BaseRepository[DocumentVector]):
             similarity = 1 - float(row[5])  # Convert distance to similarity
             if similarity >= threshold:
                 results.append({
-                    "id": str(row[0]),
-                    "document_id": str(row[1]),
+                    "id": str(UUID(bytes=row[0])),
+                    "document_id": str(UUID(bytes=row[1])),
                     "chunk_index": int(row[2]),
                     "content": str(row[3]),
                     "section_title": str(row[4]) if row[4] else None,
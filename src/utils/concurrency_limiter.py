@@ -0,0 +1,64 @@
+import asyncio
+
+from loguru import logger
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limiter that adapts its limit to server feedback.
+
+    Works like TCP congestion control (AIMD): every successful request grows
+    the limit by roughly one slot per window, and every overload signal
+    (HTTP 429/503, timeouts) shrinks it multiplicatively.
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=5)
+        async with limiter:
+            response = await client.get(url)
+        limiter.record_success()
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        initial_concurrency: int = 2,
+        adjust_overload_rate: float = 0.1,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.adjust_overload_rate = adjust_overload_rate
+
+        self._limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.min_concurrency, int(self._limit))
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Additive increase: one extra slot per window of successes."""
+        self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+
+    def record_overload(self) -> None:
+        """Multiplicative decrease on an overload signal."""
+        previous = self.concurrency
+        self._limit = max(
+            float(self.min_concurrency),
+            self._limit * (1 - self.adjust_overload_rate),
+        )
+        if self.concurrency < previous:
+            logger.debug(f"Concurrency reduced to {self.concurrency}")
@@ -6,6 +6,11 @@ from typing import Optional
 import httpx
 from loguru import logger
 
+from utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+# Responses that mean the server wants us to slow down
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
 
 class HttpClient:
     """Async HTTP client with rate limiting and retries."""
@@ -16,17 +21,40 @@ class HttpClient:
         request_timeout: float = 30.0,
         max_retries: int = 3,
         user_agent: str = "OpenJuris-Scraper/1.0",
+        max_concurrency: int = 5,
+        initial_concurrency: int = 2,
+        adjust_overload_rate: float = 0.1,
     ):
         self.rate_limit = rate_limit
         self.request_timeout = request_timeout
         self.max_retries = max_retries
         self.user_agent = user_agent
+        self.max_concurrency = max_concurrency
+        self.initial_concurrency = initial_concurrency
+        self.adjust_overload_rate = adjust_overload_rate
         self._client: Optional[httpx.AsyncClient] = None
+        self._users = 0
         self._last_request_time: float = 0
-
-    async def start(self):
-        """Initialize the HTTP client."""
+        self._rate_lock = asyncio.Lock()
+        self._limiter = self._new_limiter()
+
+    def _new_limiter(self) -> AdaptiveConcurrencyLimiter:
+        return AdaptiveConcurrencyLimiter(
+            max_concurrency=self.max_concurrency,
+            initial_concurrency=self.initial_concurrency,
+            adjust_overload_rate=self.adjust_overload_rate,
+        )
+
+    async def _open(self):
+        """Create the underlying client if it is not already open."""
         if self._client is None:
+            # The client may be shared across runs, so asyncio primitives are
+            # recreated on the loop that opens it
+            self._rate_lock = asyncio.Lock()
+            self._limiter = self._new_limiter()
+
+            # httpx advertises and decodes gzip/deflate itself, and br once
+            # brotli is importable, so no Accept-Encoding header is set here
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.request_timeout),
                 follow_redirects=True,
@@ -36,11 +64,19 @@ class HttpClient:
             )
             logger.debug("HTTP client started")
 
+    async def start(self):
+        """Initialize the HTTP client, or join it if it is already started."""
+        self._users += 1
+        await self._open()
+
     async def close(self):
-        """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Release one start(); the client is closed when the last user leaves."""
+        self._users = max(0, self._users - 1)
+        if self._users == 0 and self._client is not None:
+            # Detach before awaiting, so a start() during aclose() opens a
+            # fresh client instead of joining the one being closed
+            client, self._client = self._client, None
+            await client.aclose()
             logger.debug("HTTP client closed")
 
     async def __aenter__(self):
@@ -52,38 +88,52 @@ class HttpClient:
 
     async def _rate_limit_wait(self):
         """Wait to respect rate limiting with jitter."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        target = self.rate_limit
+        # Serialize the wait so concurrent callers are spaced out instead of
+        # all reading the same last request time and firing together
+        async with self._rate_lock:
+            now = time.time()
+            elapsed = now - self._last_request_time
+            target = self.rate_limit
 
-        # Add +/-20% jitter to avoid thundering herd
-        jitter = target * 0.2
-        wait_for = max(0, target + random.uniform(-jitter, jitter) - elapsed)
+            # Add +/-20% jitter to avoid thundering herd
+            jitter = target * 0.2
+            wait_for = max(0, target + random.uniform(-jitter, jitter) - elapsed)
 
-        if wait_for > 0:
-            await asyncio.sleep(wait_for)
+            if wait_for > 0:
+                await asyncio.sleep(wait_for)
 
-        self._last_request_time = time.time()
+            self._last_request_time = time.time()
 
     async def get_bytes(self, url: str) -> bytes:
         """Fetch URL and return response bytes."""
-        if self._client is None:
-            await self.start()
-
+        # Hold a reference for the whole request, so another user's close()
+        # cannot shut the client mid-retry and a client opened just for this
+        # call is released afterwards
+        async with self:
+            return await self._fetch(url)
+
+    async def _fetch(self, url: str) -> bytes:
+        """Fetch URL with retries; the caller holds a reference to the client."""
         await self._rate_limit_wait()
 
         for attempt in range(self.max_retries):
             try:
-                response = await self._client.get(url)
+                async with self._limiter:
+                    response = await self._client.get(url)
                 response.raise_for_status()
+                self._limiter.record_success()
                 return response.content
             except httpx.HTTPStatusError as e:
+                if e.response.status_code in OVERLOAD_STATUS_CODES:
+                    self._limiter.record_overload()
                 logger.warning(f"HTTP error {e.response.status_code} for {url}, attempt {attempt + 1}/{self.max_retries}")
                 if attempt == self.max_retries - 1:
                     raise
                 # Exponential backoff
                 await asyncio.sleep(2 ** attempt)
             except httpx.RequestError as e:
+                if isinstance(e, httpx.TimeoutException):
+                    self._limiter.record_overload()
                 logger.warning(f"Request error for {url}: {e}, attempt {attempt + 1}/{self.max_retries}")
                 if attempt == self.max_retries - 1:
                     raise
@@ -0,0 +1,45 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from loguru import logger
+
+# One pool shared by the CPU-bound work offloaded from the event loop
+# (statute parsing, long-document chunking)
+_pool: Optional[ProcessPoolExecutor] = None
+_max_workers: Optional[int] = None
+
+
+def configure_process_pool(max_workers: Optional[int]) -> None:
+    """
+    Set the worker count for the shared pool; None uses os.cpu_count().
+    Takes effect the next time the pool is started.
+    """
+    global _max_workers
+    _max_workers = max_workers
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool, starting it on first use.
+
+    Workers are spawned rather than forked: the parent runs an event loop
+    and other threads, whose state a forked child would inherit mid-use.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=_max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.debug("Process pool started")
+    return _pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut the shared pool down, cancelling queued work; it restarts on next use."""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        pool.shutdown(cancel_futures=True)
+        logger.debug("Process pool shut down")
\ No newline at end of file
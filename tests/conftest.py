@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modules import each other from src/ (e.g. "from schemas.scraped_part import ...")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
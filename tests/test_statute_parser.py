@@ -0,0 +1,26 @@
+from bs4 import BeautifulSoup
+
+from scrapers.lawphil.parsers.statute_parser import LawphilStatuteParser
+
+
+def _table(html: str):
+    return BeautifulSoup(html, "lxml").table
+
+
+def test_table_row_escapes_pipes_without_extra_columns():
+    table = _table("<table><tr><td>Plain</td><td>A | B</td></tr></table>")
+
+    markdown = LawphilStatuteParser()._table_to_markdown(table)
+
+    assert markdown == "| Plain | A \\| B |\n| --- | --- |"
+
+
+def test_table_formatted_cell_drops_converter_separator():
+    table = _table(
+        "<table><tr><td>Name</td><td>Value</td></tr>"
+        "<tr><td><b>Rate</b> | net</td><td>5%</td></tr></table>"
+    )
+
+    markdown = LawphilStatuteParser()._table_to_markdown(table)
+
+    assert markdown.splitlines()[2] == "| **Rate** \\| net | 5% |"